@@ -1,12 +1,22 @@
 import weave
 import openai
 from typing import Dict, List, Any, Optional
+import asyncio
 import json
 import time
 import os
 from .memory import MemoryManager
 from .tools import ToolRegistry
 
+class SessionState:
+    """Per-session cache so repeat turns reuse prior work"""
+    
+    def __init__(self):
+        self.turns = 0
+        self.context = ""
+        self.context_size = -1  # memory size when context was computed
+        self.last_response = None
+
 class WeaveAgent:
     """AI Agent with Weave tracing integration"""
     
@@ -16,9 +26,49 @@ class WeaveAgent:
         self.use_mock = use_mock
         if not use_mock:
             self.client = openai.OpenAI()
+        self._async_client = None
+        self._async_client_loop = None
         self.memory = MemoryManager()
         self.tools = ToolRegistry()
+        self.sessions = {}
+    
+    def _aclient(self) -> openai.AsyncOpenAI:
+        """Async client bound to the currently running event loop
+
+        Callers drive the async pipeline with asyncio.run, which builds
+        a fresh loop each time; a client reused across runs keeps httpx
+        connections bound to the previous, closed loop and fails with
+        'Event loop is closed'. Hand out one client per loop instead.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client_loop is not loop:
+            self._async_client = openai.AsyncOpenAI()
+            self._async_client_loop = loop
+        return self._async_client
+    
+    def _session(self, session_id: Optional[str]) -> Optional[SessionState]:
+        """Get (creating if needed) the state for a session"""
+        if session_id is None:
+            return None
+        return self.sessions.setdefault(session_id, SessionState())
+    
+    def _get_context(self, query: str, session: Optional[SessionState]) -> str:
+        """Memory context, cached per session
+
+        get_relevant_context refits TF-IDF over the whole memory store;
+        within a session we reuse the cached context until enough new
+        memories accumulate to plausibly change the retrieval result.
+        """
+        if session is not None and session.context_size >= 0 and \
+                len(self.memory.memories) - session.context_size < 4:
+            return session.context
         
+        context = self.memory.get_relevant_context(query)
+        if session is not None:
+            session.context = context
+            session.context_size = len(self.memory.memories)
+        return context
+    
     @weave.op()
     def reason(self, query: str, context: Optional[str] = None) -> Dict[str, Any]:
         """Core reasoning - skipped for performance (tool selection is keyword-based)"""
@@ -111,15 +161,41 @@ class WeaveAgent:
         return response.choices[0].message.content
     
     @weave.op()
-    def process(self, query: str) -> Dict[str, Any]:
+    async def agenerate_response(self, query: str, reasoning: str, tool_results: Dict[str, Any]) -> str:
+        """Async variant of generate_response for concurrent callers"""
+        if self.use_mock:
+            return f"Mock Response: Based on your query '{query}', I analyzed the situation and used tools {list(tool_results.keys())}. The results show: {str(tool_results)[:100]}... This is a simulated response for testing."
+        
+        if tool_results:
+            messages = [
+                {"role": "system", "content": "Generate a helpful response using the tool results. Be concise and direct."},
+                {"role": "user", "content": f"Query: {query}\nTool Results: {json.dumps(tool_results)}"}
+            ]
+        else:
+            messages = [
+                {"role": "system", "content": "Answer the query directly and helpfully."},
+                {"role": "user", "content": query}
+            ]
+        
+        response = await self._aclient().chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=self.max_tokens
+        )
+        
+        return response.choices[0].message.content
+    
+    @weave.op()
+    def process(self, query: str, session_id: Optional[str] = None) -> Dict[str, Any]:
         """Main agent processing pipeline"""
         start_time = time.time()
+        session = self._session(session_id)
         
         # Store in memory
         self.memory.add_interaction(query, "user")
         
-        # Get context from memory
-        context = self.memory.get_relevant_context(query)
+        # Get context from memory (cached within a session)
+        context = self._get_context(query, session)
         
         # Reasoning step
         reasoning_result = self.reason(query, context)
@@ -136,6 +212,10 @@ class WeaveAgent:
         # Store response in memory
         self.memory.add_interaction(response, "assistant")
         
+        if session is not None:
+            session.turns += 1
+            session.last_response = response
+        
         end_time = time.time()
         
         result = {
@@ -144,8 +224,113 @@ class WeaveAgent:
             "selected_tools": selected_tools,
             "tool_results": tool_results,
             "response": response,
+            "success": all(r.get("ok", "error" not in r) for r in tool_results.values()),
+            "processing_time": end_time - start_time,
+            "context_used": context
+        }
+        
+        return result
+    
+    @weave.op()
+    async def astream(self, query: str, on_token, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Stream the response, awaiting on_token for each text chunk
+
+        Same pipeline as aprocess, but the generation step uses
+        stream=True so callers can render tokens as they arrive.
+        """
+        start_time = time.time()
+        session = self._session(session_id)
+        
+        self.memory.add_interaction(query, "user")
+        context = self._get_context(query, session)
+        reasoning_result = self.reason(query, context)
+        selected_tools = self.select_tools(query, reasoning_result["reasoning"])
+        tool_results = self.execute_tools(selected_tools, query)
+        
+        if self.use_mock:
+            response = f"Mock Response: Based on your query '{query}', I analyzed the situation and used tools {list(tool_results.keys())}. The results show: {str(tool_results)[:100]}... This is a simulated response for testing."
+            await on_token(response)
+        else:
+            if tool_results:
+                messages = [
+                    {"role": "system", "content": "Generate a helpful response using the tool results. Be concise and direct."},
+                    {"role": "user", "content": f"Query: {query}\nTool Results: {json.dumps(tool_results)}"}
+                ]
+            else:
+                messages = [
+                    {"role": "system", "content": "Answer the query directly and helpfully."},
+                    {"role": "user", "content": query}
+                ]
+            
+            stream = await self._aclient().chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=self.max_tokens,
+                stream=True
+            )
+            
+            parts = []
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    parts.append(delta)
+                    await on_token(delta)
+            response = "".join(parts)
+        
+        self.memory.add_interaction(response, "assistant")
+        
+        if session is not None:
+            session.turns += 1
+            session.last_response = response
+        
+        end_time = time.time()
+        
+        return {
+            "query": query,
+            "reasoning": reasoning_result,
+            "selected_tools": selected_tools,
+            "tool_results": tool_results,
+            "response": response,
+            "success": all(r.get("ok", "error" not in r) for r in tool_results.values()),
             "processing_time": end_time - start_time,
             "context_used": context
         }
+    
+    @weave.op()
+    async def aprocess(self, query: str) -> Dict[str, Any]:
+        """Async processing pipeline - lets callers overlap several queries"""
+        start_time = time.time()
+        
+        # Store in memory
+        self.memory.add_interaction(query, "user")
+        
+        # Get context from memory
+        context = self.memory.get_relevant_context(query)
+        
+        # Reasoning step
+        reasoning_result = self.reason(query, context)
+        
+        # Tool selection
+        selected_tools = self.select_tools(query, reasoning_result["reasoning"])
+        
+        # Tool execution
+        tool_results = self.execute_tools(selected_tools, query)
+        
+        # Response generation (the only I/O-bound step) runs on the async client
+        response = await self.agenerate_response(query, reasoning_result["reasoning"], tool_results)
+        
+        # Store response in memory
+        self.memory.add_interaction(response, "assistant")
+        
+        end_time = time.time()
         
-        return result
\ No newline at end of file
+        return {
+            "query": query,
+            "reasoning": reasoning_result,
+            "selected_tools": selected_tools,
+            "tool_results": tool_results,
+            "response": response,
+            "success": all(r.get("ok", "error" not in r) for r in tool_results.values()),
+            "processing_time": end_time - start_time,
+            "context_used": context
+        }
\ No newline at end of file
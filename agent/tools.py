@@ -120,20 +120,29 @@ class ToolRegistry:
     
     @weave.op()
     def execute(self, tool_name: str, *args, **kwargs) -> Dict[str, Any]:
-        """Execute a tool with tracking"""
+        """Execute a tool with tracking
+
+        Every returned dict carries an explicit "ok" flag so callers can
+        check success without stringifying the whole payload.
+        """
         if tool_name not in self.tools:
-            return {"error": f"Tool '{tool_name}' not found"}
+            return {"ok": False, "error": f"Tool '{tool_name}' not found"}
         
         tool = self.tools[tool_name]
         tool["usage_count"] += 1
         
         try:
             result = tool["function"](*args, **kwargs)
-            tool["success_count"] += 1
+            # Handlers report failures as {"error": ...} instead of raising
+            result["ok"] = "error" not in result
+            if result["ok"]:
+                tool["success_count"] += 1
+            else:
+                tool["error_count"] += 1
             return result
         except Exception as e:
             tool["error_count"] += 1
-            return {"error": str(e)}
+            return {"ok": False, "error": str(e)}
     
     def list_tools(self) -> List[str]:
         """List available tools"""
@@ -1,5 +1,7 @@
 import weave
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+import asyncio
+import json
 import openai
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
@@ -9,10 +11,28 @@ import numpy as np
 class ResponseQualityEvaluator:
     """Evaluate response quality using multiple metrics"""
     
+    # Fixed metric order shared by evaluate_array and its callers
+    METRIC_NAMES = ("relevance", "coherence", "completeness", "length_score")
+    
     def __init__(self):
         self.client = openai.OpenAI()
+        self._async_client = None
+        self._async_client_loop = None
         self.vectorizer = TfidfVectorizer()
     
+    def _aclient(self) -> openai.AsyncOpenAI:
+        """Async client bound to the currently running event loop
+
+        Each asyncio.run call site gets a loop of its own; reusing one
+        client across them leaves keep-alive connections bound to a
+        closed loop, so a fresh client is created per loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client_loop is not loop:
+            self._async_client = openai.AsyncOpenAI()
+            self._async_client_loop = loop
+        return self._async_client
+    
     @weave.op()
     def evaluate_relevance(self, query: str, response: str) -> float:
         """Evaluate response relevance to query"""
@@ -62,6 +82,44 @@ class ResponseQualityEvaluator:
         except:
             return 0.5
     
+    @weave.op()
+    async def aevaluate_coherence(self, response: str) -> float:
+        """Async variant of evaluate_coherence"""
+        messages = [
+            {"role": "system", "content": "Rate the coherence of this response on a scale of 0-1. Return only the number."},
+            {"role": "user", "content": response}
+        ]
+        
+        try:
+            result = await self._aclient().chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=messages,
+                max_tokens=10
+            )
+            score = float(result.choices[0].message.content.strip())
+            return min(max(score, 0.0), 1.0)
+        except:
+            return 0.5
+    
+    @weave.op()
+    async def aevaluate_completeness(self, query: str, response: str) -> float:
+        """Async variant of evaluate_completeness"""
+        messages = [
+            {"role": "system", "content": "Rate how completely this response addresses the query (0-1). Return only the number."},
+            {"role": "user", "content": f"Query: {query}\nResponse: {response}"}
+        ]
+        
+        try:
+            result = await self._aclient().chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=messages,
+                max_tokens=10
+            )
+            score = float(result.choices[0].message.content.strip())
+            return min(max(score, 0.0), 1.0)
+        except:
+            return 0.5
+    
     @weave.op()
     def evaluate(self, query: str, response: str) -> Dict[str, float]:
         """Comprehensive response evaluation"""
@@ -71,6 +129,88 @@ class ResponseQualityEvaluator:
             "completeness": self.evaluate_completeness(query, response),
             "length_score": min(len(response) / 500, 1.0)  # Normalize by expected length
         }
+    
+    @weave.op()
+    def evaluate_array(self, query: str, response: str) -> np.ndarray:
+        """Scores as a fixed-order array aligned with METRIC_NAMES
+
+        Lets hot callers take arr.mean() (and stack arrays for rollups)
+        instead of iterating a dict per interaction.
+        """
+        return np.array([
+            self.evaluate_relevance(query, response),
+            self.evaluate_coherence(response),
+            self.evaluate_completeness(query, response),
+            min(len(response) / 500, 1.0)
+        ])
+    
+    @weave.op()
+    async def aevaluate(self, query: str, response: str) -> Dict[str, float]:
+        """Comprehensive async evaluation for concurrent callers"""
+        # The two judge calls are independent - run them concurrently
+        coherence, completeness = await asyncio.gather(
+            self.aevaluate_coherence(response),
+            self.aevaluate_completeness(query, response)
+        )
+        return {
+            "relevance": self.evaluate_relevance(query, response),
+            "coherence": coherence,
+            "completeness": completeness,
+            "length_score": min(len(response) / 500, 1.0)  # Normalize by expected length
+        }
+    
+    @weave.op()
+    async def aevaluate_batch(self, pairs: List[Tuple[str, str]]) -> List[Dict[str, float]]:
+        """Score many (query, response) pairs with a single judge call
+
+        Coherence and completeness for every pair are requested in one
+        JSON-returning prompt instead of two round-trips per pair;
+        relevance and length are computed locally as usual.
+        """
+        if not pairs:
+            return []
+        
+        numbered = "\n\n".join(
+            f"Item {i}:\nQuery: {query}\nResponse: {response}"
+            for i, (query, response) in enumerate(pairs)
+        )
+        messages = [
+            {"role": "system", "content": 'For each numbered item, rate the response coherence and completeness on 0-1 scales. Return only JSON: {"scores": [{"coherence": x, "completeness": y}, ...]} with one entry per item, in order.'},
+            {"role": "user", "content": numbered}
+        ]
+        
+        try:
+            result = await self._aclient().chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=messages,
+                max_tokens=25 * len(pairs) + 25,
+                response_format={"type": "json_object"}
+            )
+            judged = json.loads(result.choices[0].message.content)["scores"]
+        except:
+            judged = []
+        # Pad or trim so a short/overlong judge reply still yields one
+        # (neutral-fallback) evaluation per pair
+        judged = judged[:len(pairs)] + [{}] * (len(pairs) - len(judged))
+        
+        def judged_score(scores, key):
+            """Clamped judge score, neutral on any schema deviation"""
+            try:
+                return min(max(float(scores.get(key, 0.5)), 0.0), 1.0)
+            except:
+                return 0.5
+        
+        evaluations = []
+        for (query, response), scores in zip(pairs, judged):
+            if not isinstance(scores, dict):
+                scores = {}
+            evaluations.append({
+                "relevance": self.evaluate_relevance(query, response),
+                "coherence": judged_score(scores, "coherence"),
+                "completeness": judged_score(scores, "completeness"),
+                "length_score": min(len(response) / 500, 1.0)
+            })
+        return evaluations
 
 @weave.op()
 class ToolUsageEvaluator:
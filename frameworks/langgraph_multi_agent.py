@@ -154,7 +154,7 @@ class LangGraphMultiAgent:
         return state["task_analysis"]["route"]
     
     @weave.op()
-    def research_agent_node(self, state: AgentState) -> AgentState:
+    async def research_agent_node(self, state: AgentState) -> AgentState:
         """Research specialist agent"""
         messages = state["messages"]
         query = messages[-1].content if messages else ""
@@ -167,7 +167,9 @@ class LangGraphMultiAgent:
                 ("human", "{query}")
             ])
             chain = prompt | self.llm
-            response = chain.invoke({"query": query}).content
+            # chain.invoke blocks on the HTTP round-trip; run it in a worker
+            # thread so the event loop can service sibling branches
+            response = (await asyncio.to_thread(chain.invoke, {"query": query})).content
         
         result = {
             "agent": "research",
@@ -186,7 +188,7 @@ class LangGraphMultiAgent:
         }
     
     @weave.op()
-    def analysis_agent_node(self, state: AgentState) -> AgentState:
+    async def analysis_agent_node(self, state: AgentState) -> AgentState:
         """Analysis specialist agent"""
         messages = state["messages"]
         query = messages[-1].content if messages else ""
@@ -199,7 +201,9 @@ class LangGraphMultiAgent:
                 ("human", "{query}")
             ])
             chain = prompt | self.llm
-            response = chain.invoke({"query": query}).content
+            # chain.invoke blocks on the HTTP round-trip; run it in a worker
+            # thread so the event loop can service sibling branches
+            response = (await asyncio.to_thread(chain.invoke, {"query": query})).content
         
         result = {
             "agent": "analysis",
@@ -218,7 +222,7 @@ class LangGraphMultiAgent:
         }
     
     @weave.op()
-    def writing_agent_node(self, state: AgentState) -> AgentState:
+    async def writing_agent_node(self, state: AgentState) -> AgentState:
         """Writing specialist agent"""
         messages = state["messages"]
         query = messages[-1].content if messages else ""
@@ -231,7 +235,9 @@ class LangGraphMultiAgent:
                 ("human", "{query}")
             ])
             chain = prompt | self.llm
-            response = chain.invoke({"query": query}).content
+            # chain.invoke blocks on the HTTP round-trip; run it in a worker
+            # thread so the event loop can service sibling branches
+            response = (await asyncio.to_thread(chain.invoke, {"query": query})).content
         
         result = {
             "agent": "writing",
@@ -296,7 +302,7 @@ class LangGraphMultiAgent:
         }
     
     @weave.op()
-    def synthesizer_node(self, state: AgentState) -> AgentState:
+    async def synthesizer_node(self, state: AgentState) -> AgentState:
         """Synthesize results from all agents"""
         specialist_results = state.get("specialist_results", {})
         
@@ -321,7 +327,7 @@ class LangGraphMultiAgent:
                     ("human", "{synthesis_prompt}")
                 ])
                 chain = prompt | self.llm
-                final_response = chain.invoke({"synthesis_prompt": synthesis_prompt}).content
+                final_response = (await asyncio.to_thread(chain.invoke, {"synthesis_prompt": synthesis_prompt})).content
         
         return {
             **state,
@@ -344,8 +350,8 @@ class LangGraphMultiAgent:
             processing_time=0.0
         )
         
-        # Execute workflow
-        final_state = self.graph.invoke(initial_state)
+        # Execute workflow - nodes are async, so drive via ainvoke
+        final_state = asyncio.run(self.graph.ainvoke(initial_state))
         
         processing_time = time.time() - start_time
         
@@ -5,12 +5,18 @@ Provides standardized tool interfaces for multi-agent system
 
 import weave
 from typing import Dict, List, Any, Optional
+import hashlib
 import json
+import os
 import asyncio
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 import time
 import random
 
+# On-disk cache for discovered tool catalogs, keyed by server source hash
+CATALOG_CACHE_DIR = os.path.expanduser("~/.cache/wb")
+
 @dataclass
 class MCPTool:
     """MCP Tool definition"""
@@ -267,6 +273,99 @@ class MCPServer:
         
         return stats
 
+class MCPSession:
+    """Reusable handle onto an MCP server
+
+    Stands in for a persistent client session: callers reuse pooled
+    sessions across queries instead of paying per-call setup/teardown.
+    """
+
+    def __init__(self, server: MCPServer):
+        self.server = server
+        self.calls = 0
+        self.created_at = time.time()
+
+    async def call_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a tool through this session"""
+        self.calls += 1
+        return await self.server.call_tool(tool_name, parameters)
+
+class MCPSessionPool:
+    """Pool of reusable MCP sessions"""
+
+    def __init__(self, server: MCPServer, max_idle: int = 8):
+        self.server = server
+        self.max_idle = max_idle
+        self._idle = []
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow a session from the pool, returning it on exit"""
+        async with self._lock:
+            session = self._idle.pop() if self._idle else MCPSession(self.server)
+        try:
+            yield session
+        finally:
+            async with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(session)
+
+# Process-wide session pools shared across agent instances, keyed by a
+# hash of the MCP configuration so identical setups reuse one pool
+_SHARED_POOLS: Dict[str, MCPSessionPool] = {}
+_SHARED_REFCOUNTS: Dict[str, int] = {}
+
+def pool_key(config: Dict[str, Any]) -> str:
+    """Stable cache key for an MCP configuration"""
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()[:16]
+
+def acquire_shared_pool(server: MCPServer, config: Dict[str, Any]):
+    """Get (or create) the shared session pool for this configuration
+
+    Returns (key, pool); callers pass the key back to release_shared_pool
+    when they shut down so idle pools can be discarded.
+    """
+    key = pool_key(config)
+    if key not in _SHARED_POOLS:
+        _SHARED_POOLS[key] = MCPSessionPool(server)
+        _SHARED_REFCOUNTS[key] = 0
+    _SHARED_REFCOUNTS[key] += 1
+    return key, _SHARED_POOLS[key]
+
+def release_shared_pool(key: str):
+    """Drop one reference to a shared pool, discarding it at zero"""
+    if key in _SHARED_REFCOUNTS:
+        _SHARED_REFCOUNTS[key] -= 1
+        if _SHARED_REFCOUNTS[key] <= 0:
+            del _SHARED_REFCOUNTS[key]
+            del _SHARED_POOLS[key]
+
+def load_tool_catalog(server: MCPServer) -> List[Dict[str, Any]]:
+    """Load the tool catalog from the on-disk discovery cache
+
+    The cache key is a hash of this server's source, so code changes
+    invalidate stale catalogs automatically. Saves repeating the
+    discovery phase on every process start.
+    """
+    try:
+        with open(__file__, "rb") as f:
+            key = hashlib.sha256(f.read()).hexdigest()[:16]
+        cache_path = os.path.join(CATALOG_CACHE_DIR, f"tools-{key}.json")
+
+        if os.path.exists(cache_path):
+            with open(cache_path, "r") as f:
+                return json.load(f)
+
+        catalog = server.list_tools()
+        os.makedirs(CATALOG_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump(catalog, f)
+        return catalog
+    except Exception:
+        # Cache problems should never break discovery itself
+        return server.list_tools()
+
 # Global MCP server instance
 mcp_server = MCPServer()
 
@@ -22,21 +22,78 @@ class Alert:
     value: Any
     threshold: Any
 
+class SlidingWindowAggregator:
+    """Two-stack sliding-window aggregator (de-amortized bankers style)
+
+    Maintains any associative aggregate over a FIFO window in O(1) amortized
+    time per push/evict, so window statistics never require a full rescan.
+    Values here are (count, sum, sum_sq, min, max) tuples combined with _combine.
+    """
+
+    _IDENTITY = (0, 0.0, 0.0, float('inf'), float('-inf'))
+
+    @staticmethod
+    def _combine(a, b):
+        """Combine two (count, sum, sum_sq, min, max) partial aggregates"""
+        return (
+            a[0] + b[0],
+            a[1] + b[1],
+            a[2] + b[2],
+            min(a[3], b[3]),
+            max(a[4], b[4])
+        )
+
+    def __init__(self):
+        self._front = []  # (entry, running aggregate of entry + newer front items)
+        self._back = []
+        self._back_agg = self._IDENTITY
+
+    def push(self, value: float):
+        """Add a value to the window"""
+        entry = (1, value, value * value, value, value)
+        self._back.append(entry)
+        self._back_agg = self._combine(self._back_agg, entry)
+
+    def evict(self):
+        """Drop the oldest value from the window"""
+        if not self._front:
+            # Flip the back stack, recording suffix aggregates as we go
+            agg = self._IDENTITY
+            while self._back:
+                entry = self._back.pop()
+                agg = self._combine(entry, agg)
+                self._front.append((entry, agg))
+            self._back_agg = self._IDENTITY
+        if self._front:
+            self._front.pop()
+
+    def query(self):
+        """Get the (count, sum, sum_sq, min, max) aggregate for the full window"""
+        front_agg = self._front[-1][1] if self._front else self._IDENTITY
+        return self._combine(front_agg, self._back_agg)
+
+    def __len__(self):
+        return len(self._front) + len(self._back)
+
 @weave.op()
 class ProductionPerformanceMonitor:
     """Production performance monitor with Weave + WandB integration"""
-    
+
+    # Shared (warning, error) threshold pairs - class-level so the record
+    # path unpacks one tuple instead of chasing nested per-instance dicts
+    _THRESHOLDS = {
+        "response_time": (5.0, 10.0),
+        "error_rate": (0.1, 0.2),
+        "tool_failure_rate": (0.05, 0.15),
+        "quality_score": (0.6, 0.4)
+    }
+
     def __init__(self, window_size: int = 100, project_name: str = "agent-monitoring"):
         self.window_size = window_size
         self.project_name = project_name
         self.metrics = defaultdict(lambda: deque(maxlen=window_size))
+        self.window_aggregators = defaultdict(SlidingWindowAggregator)
         self.alerts = []
-        self.thresholds = {
-            "response_time": {"warning": 5.0, "error": 10.0},
-            "error_rate": {"warning": 0.1, "error": 0.2},
-            "tool_failure_rate": {"warning": 0.05, "error": 0.15},
-            "quality_score": {"warning": 0.6, "error": 0.4}
-        }
     
     @weave.op()
     def record_metric(self, metric_name: str, value: Any, timestamp: float = None):
@@ -48,7 +105,14 @@ class ProductionPerformanceMonitor:
             "value": value,
             "timestamp": timestamp
         })
-        
+
+        # Maintain O(1) window aggregates for numeric metrics
+        if isinstance(value, (int, float)):
+            aggregator = self.window_aggregators[metric_name]
+            aggregator.push(value)
+            if len(aggregator) > self.window_size:
+                aggregator.evict()
+
         # Log to WandB
         wandb.log({
             f"monitor/{metric_name}": value,
@@ -60,16 +124,15 @@ class ProductionPerformanceMonitor:
     
     def _check_thresholds(self, metric_name: str, value: Any):
         """Check if metric exceeds thresholds"""
-        if metric_name not in self.thresholds:
+        thresholds = self._THRESHOLDS.get(metric_name)
+        if thresholds is None or not isinstance(value, (int, float)):
             return
-        
-        thresholds = self.thresholds[metric_name]
-        
-        if isinstance(value, (int, float)):
-            if value >= thresholds.get("error", float('inf')):
-                self._create_alert("ERROR", f"{metric_name} exceeded error threshold", metric_name, value, thresholds["error"])
-            elif value >= thresholds.get("warning", float('inf')):
-                self._create_alert("WARNING", f"{metric_name} exceeded warning threshold", metric_name, value, thresholds["warning"])
+
+        warning, error = thresholds
+        if value >= error:
+            self._create_alert("ERROR", f"{metric_name} exceeded error threshold", metric_name, value, error)
+        elif value >= warning:
+            self._create_alert("WARNING", f"{metric_name} exceeded warning threshold", metric_name, value, warning)
     
     def _create_alert(self, level: str, message: str, metric: str, value: Any, threshold: Any):
         """Create an alert with full tracking"""
@@ -96,18 +159,27 @@ class ProductionPerformanceMonitor:
         if metric_name not in self.metrics or not self.metrics[metric_name]:
             return {"error": "No data available"}
         
-        values = [entry["value"] for entry in self.metrics[metric_name] if isinstance(entry["value"], (int, float))]
-        
-        if not values:
+        aggregator = self.window_aggregators.get(metric_name)
+        if aggregator is None or len(aggregator) == 0:
             return {"error": "No numeric data available"}
-        
+
+        count, total, sum_sq, min_value, max_value = aggregator.query()
+        mean = total / count
+        variance = max(sum_sq / count - mean * mean, 0.0)
+
+        latest = None
+        for entry in reversed(self.metrics[metric_name]):
+            if isinstance(entry["value"], (int, float)):
+                latest = entry["value"]
+                break
+
         stats = {
-            "count": len(values),
-            "mean": sum(values) / len(values),
-            "min": min(values),
-            "max": max(values),
-            "latest": values[-1] if values else None,
-            "std_dev": self._calculate_std_dev(values)
+            "count": count,
+            "mean": mean,
+            "min": min_value,
+            "max": max_value,
+            "latest": latest,
+            "std_dev": variance ** 0.5
         }
         
         # Log stats to WandB
@@ -120,14 +192,6 @@ class ProductionPerformanceMonitor:
         
         return stats
     
-    def _calculate_std_dev(self, values: List[float]) -> float:
-        """Calculate standard deviation"""
-        if len(values) < 2:
-            return 0.0
-        mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
-        return variance ** 0.5
-    
     @weave.op()
     def get_recent_alerts(self, hours: int = 24) -> List[Alert]:
         """Get recent alerts"""
@@ -178,15 +242,15 @@ class ProductionPerformanceMonitor:
 class ProductionQualityMonitor:
     """Production quality monitor with comprehensive tracking"""
     
+    # Class-level quality bands shared by all instances
+    MINIMUM_ACCEPTABLE = 0.6
+    TARGET_QUALITY = 0.8
+    EXCELLENT_QUALITY = 0.9
+
     def __init__(self, project_name: str = "quality-monitoring"):
         self.project_name = project_name
         self.quality_scores = deque(maxlen=1000)
         self.quality_trends = defaultdict(list)
-        self.quality_thresholds = {
-            "minimum_acceptable": 0.6,
-            "target_quality": 0.8,
-            "excellent_quality": 0.9
-        }
     
     @weave.op()
     def record_quality_score(self, score: float, category: str = "general", details: Dict[str, Any] = None):
@@ -213,9 +277,9 @@ class ProductionQualityMonitor:
     
     def _check_quality_thresholds(self, score: float, category: str):
         """Check quality score against thresholds"""
-        if score < self.quality_thresholds["minimum_acceptable"]:
+        if score < self.MINIMUM_ACCEPTABLE:
             wandb.log({f"quality_alerts/{category}_below_minimum": score})
-        elif score >= self.quality_thresholds["excellent_quality"]:
+        elif score >= self.EXCELLENT_QUALITY:
             wandb.log({f"quality_alerts/{category}_excellent": score})
     
     @weave.op()
@@ -3,9 +3,31 @@ from typing import Dict, List, Any, Optional
 import openai
 import asyncio
 import json
+import re
 import time
 from agent.tools import ToolRegistry
 
+WORD_RE = re.compile(r"[a-z']+")
+
+# Keyword -> specialist routing table, scanned in a single pass over the
+# query tokens instead of one substring sweep per specialist
+SPECIALIST_KEYWORDS = {
+    "research": "research",
+    "information": "research",
+    "data": "research",
+    "analyze": "analysis",
+    "analysis": "analysis",
+    "insights": "analysis",
+    "write": "writing",
+    "document": "writing",
+    "report": "writing",
+    "technical": "technical",
+    "implement": "technical",
+    "code": "technical"
+}
+
+SPECIALIST_ORDER = ("research", "analysis", "writing", "technical")
+
 class SpecialistAgent:
     """Specialized agent for specific domains"""
     
@@ -14,9 +36,24 @@ class SpecialistAgent:
         self.use_mock = use_mock
         self.system_prompt = self._get_system_prompt()
         self.tools = ToolRegistry()
+        self._async_client = None
+        self._async_client_loop = None
         if not use_mock:
             self.client = openai.OpenAI()
     
+    def _aclient(self) -> openai.AsyncOpenAI:
+        """Async client bound to the currently running event loop
+
+        aprocess_query is driven by asyncio.run, which makes a new loop
+        per call; a client shared across runs keeps connections bound to
+        a closed loop, so hand out one client per loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client_loop is not loop:
+            self._async_client = openai.AsyncOpenAI()
+            self._async_client_loop = loop
+        return self._async_client
+    
     def _get_system_prompt(self) -> str:
         """Get system prompt based on specialty"""
         prompts = {
@@ -96,6 +133,46 @@ class SpecialistAgent:
             "tool_results": tool_results,
             "tokens_used": response.usage.total_tokens
         }
+    
+    @weave.op()
+    async def aspecialized_process(self, query: str, context: Optional[str] = None) -> Dict[str, Any]:
+        """Async variant of specialized_process for concurrent dispatch"""
+        tool_results = self._detect_and_execute_tools(query)
+        
+        if self.use_mock:
+            response = f"Mock {self.specialty} specialist: Analyzed '{query[:50]}...' with {self.specialty} expertise."
+            if tool_results:
+                response += f" Tool results: {tool_results}"
+            return {
+                "specialty": self.specialty,
+                "response": response,
+                "tool_results": tool_results,
+                "tokens_used": 50
+            }
+        
+        user_content = f"Query: {query}"
+        if context:
+            user_content += f"\nContext: {context}"
+        if tool_results:
+            user_content += f"\nTool Results: {json.dumps(tool_results)}"
+        
+        messages = [
+            {"role": "system", "content": self.system_prompt + " IMPORTANT: You MUST use ONLY the tool results provided. Do NOT use your training data or make assumptions. Report exactly what the tools return."},
+            {"role": "user", "content": user_content}
+        ]
+        
+        response = await self._aclient().chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            max_tokens=300
+        )
+        
+        return {
+            "specialty": self.specialty,
+            "response": response.choices[0].message.content,
+            "tool_results": tool_results,
+            "tokens_used": response.usage.total_tokens
+        }
 
 class CoordinatorAgent:
     """Coordinator agent for multi-agent workflows"""
@@ -117,16 +194,14 @@ class CoordinatorAgent:
         
         if self.use_mock:
             query_lower = query.lower()
-            needed = []
-            if any(word in query_lower for word in ["research", "information", "data"]):
-                needed.append("research")
-            if any(word in query_lower for word in ["analyze", "analysis", "insights"]):
-                needed.append("analysis")
-            if any(word in query_lower for word in ["write", "document", "report"]):
-                needed.append("writing")
-            if any(word in query_lower for word in ["technical", "implement", "code"]):
-                needed.append("technical")
-            
+            # Word regex so keywords still match with punctuation attached
+            matched = {
+                SPECIALIST_KEYWORDS[token]
+                for token in WORD_RE.findall(query_lower)
+                if token in SPECIALIST_KEYWORDS
+            }
+            needed = [s for s in SPECIALIST_ORDER if s in matched]
+
             if not needed:
                 needed = available_specialists[:1]
             
@@ -198,6 +273,25 @@ Example: {{"specialists_needed": ["research", "analysis"], "execution_order": ["
         
         return results
     
+    @weave.op()
+    async def acoordinate_specialists(self, query: str, specialist_assignments: Dict[str, Any]) -> Dict[str, Any]:
+        """Run independent specialists concurrently
+
+        Specialists do not depend on each other's output (only synthesis
+        does), so dispatch them all at once bounded by a small semaphore.
+        """
+        execution_order = specialist_assignments.get("execution_order", [])
+        names = [name for name in execution_order if name in self.specialists]
+        
+        semaphore = asyncio.Semaphore(4)
+        
+        async def run_one(name):
+            async with semaphore:
+                return await self.specialists[name].aspecialized_process(query, None)
+        
+        responses = await asyncio.gather(*(run_one(name) for name in names))
+        return dict(zip(names, responses))
+    
     @weave.op()
     def synthesize_results(self, query: str, specialist_results: Dict[str, Any]) -> str:
         """Synthesize results from multiple specialists"""
@@ -205,10 +299,11 @@ Example: {{"specialists_needed": ["research", "analysis"], "execution_order": ["
             specialists_used = ", ".join(specialist_results.keys())
             return f"Mock synthesis: Combined insights from {specialists_used} specialists for query '{query[:50]}...'. Final recommendation based on multi-agent analysis."
         
-        results_summary = "\n".join([
-            f"{name}: {result['response']}" 
+        # Generator feeds join directly - no intermediate list allocation
+        results_summary = "\n".join(
+            f"{name}: {result['response']}"
             for name, result in specialist_results.items()
-        ])
+        )
         
         messages = [
             {"role": "system", "content": "Synthesize specialist responses into a coherent answer. Use ONLY the information provided by specialists. Do NOT add information from your training data."},
@@ -262,3 +357,30 @@ class MultiAgentWorkflow:
             "processing_time": end_time - start_time,
             "total_tokens": sum(result.get("tokens_used", 0) for result in specialist_results.values())
         }
+    
+    @weave.op()
+    async def aprocess_query(self, query: str) -> Dict[str, Any]:
+        """Process a query with specialists running concurrently"""
+        start_time = time.time()
+        
+        # Step 1: Analyze task
+        task_analysis = self.coordinator.analyze_task(query)
+        
+        # Step 2: Run specialists in parallel - wall time is the slowest
+        # specialist instead of the sum of all of them
+        specialist_results = await self.coordinator.acoordinate_specialists(query, task_analysis)
+        
+        # Step 3: Synthesize results (depends on every specialist, so it
+        # stays a single serialized stage)
+        final_response = self.coordinator.synthesize_results(query, specialist_results)
+        
+        end_time = time.time()
+        
+        return {
+            "query": query,
+            "task_analysis": task_analysis,
+            "specialist_results": specialist_results,
+            "final_response": final_response,
+            "processing_time": end_time - start_time,
+            "total_tokens": sum(result.get("tokens_used", 0) for result in specialist_results.values())
+        }
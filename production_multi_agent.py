@@ -7,25 +7,131 @@ import weave
 import wandb
 from typing import Dict, List, Any, Optional, TypedDict, Annotated
 from langgraph.graph import StateGraph, END
+from langgraph.constants import Send
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 from langchain_core.tools import tool
 from langchain_core.prompts import ChatPromptTemplate
+import hashlib
 import json
+import re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+import threading
 import time
 import operator
 import os
 from datetime import datetime
-from mcp_integration.mcp_server import mcp_server, call_mcp_tool
+from mcp_integration.mcp_server import (
+    mcp_server, load_tool_catalog,
+    MCPSessionPool, acquire_shared_pool, release_shared_pool
+)
 import asyncio
 
+# Routing keyword sets, hoisted to module level so coordinator_node does
+# O(1) set intersections instead of rebuilding keyword lists per query
+MATH_KEYS = frozenset({"calculate", "math"})
+MATH_OPS = "+-*/"
+WEATHER_KEYS = frozenset({"weather"})
+TIME_KEYS = frozenset({"time"})
+RESEARCH_KEYS = frozenset({"research", "find", "information", "search"})
+ANALYSIS_KEYS = frozenset({"analyze", "analysis", "insights", "examine"})
+WRITING_KEYS = frozenset({"write", "document", "report", "create"})
+
+# Precompiled patterns shared by the coordinator and mcp_executor
+WORD_RE = re.compile(r"[a-z']+")
+CALC_RE = re.compile(r'[\d+\-*/().\s]+')
+MULTI_TASK_RE = re.compile(r'\b(and|also|then|after)\b', re.I)
+
+def _pretty(obj) -> str:
+    """Pretty-print a dict for messages, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# Location phrase after in/for/at - capitalized runs keep multi-word
+# places like "New York City" intact
+LOC_RE = re.compile(r"\b(?:in|for|at)\s+([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+){0,3})")
+
+def merge_results(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge specialist results written by parallel branches"""
+    return {**a, **b}
+
+class ResponseStore:
+    """In-memory store for large agent responses
+
+    Graph state keeps only small refs, so checkpoint serialization and
+    per-step state copies stay O(metadata) instead of O(response text).
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def put(self, response: str) -> str:
+        """Store a response and return its ref"""
+        with self._lock:
+            ref = f"resp-{self._next_id}"
+            self._next_id += 1
+        self._data[ref] = response
+        return ref
+
+    def get(self, ref: str) -> str:
+        """Fetch a stored response (empty string for unknown refs)"""
+        return self._data.get(ref, "")
+
+response_store = ResponseStore()
+
+def _resolve_response(record: Dict[str, Any]) -> str:
+    """Get a result record's response text, dereferencing stored refs"""
+    if "response_ref" in record:
+        return response_store.get(record["response_ref"])
+    return record.get("response", "")
+
+class AsyncLoopThread(threading.Thread):
+    """Daemon thread hosting one persistent event loop
+
+    Sync callers (Streamlit, Flask) submit coroutines here instead of
+    spinning up a fresh loop per asyncio.run, so MCP sessions created on
+    this loop stay reusable across requests and threads.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True, name="agent-event-loop")
+        self.loop = asyncio.new_event_loop()
+        self.start()
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro):
+        """Schedule a coroutine on the shared loop, returning a Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+_shared_loop = None
+
+def get_shared_loop() -> AsyncLoopThread:
+    """Get (lazily starting) the process-wide event-loop thread"""
+    global _shared_loop
+    if _shared_loop is None:
+        _shared_loop = AsyncLoopThread()
+    return _shared_loop
+
 # State definition for LangGraph
 class AgentState(TypedDict):
     messages: Annotated[List[BaseMessage], operator.add]
     current_agent: str
+    query_lower: str
+    query_tokens: List[str]
     task_analysis: Dict[str, Any]
-    specialist_results: Dict[str, Any]
-    tools_used: List[str]
+    specialist_results: Annotated[Dict[str, Any], merge_results]
+    tools_used: Annotated[List[str], operator.add]
+    loop_hashes: Annotated[List[str], operator.add]
     processing_time: float
     wandb_run_id: str
 
@@ -33,12 +139,36 @@ class AgentState(TypedDict):
 class ProductionMultiAgent:
     """Production multi-agent system with Weave + WandB tracking"""
     
-    def __init__(self, use_mock: bool = False, project_name: str = "multi-agent-system"):
+    def __init__(self, use_mock: bool = False, project_name: str = "multi-agent-system",
+                 no_share: bool = False):
         self.use_mock = use_mock
         self.project_name = project_name
         self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0) if not use_mock else None
-        
-        # Initialize WandB
+
+        # Prompts are fixed strings, so build each prompt | llm chain once
+        # instead of re-parsing the templates on every node invocation
+        if not use_mock:
+            self._research_chain = ChatPromptTemplate.from_messages([
+                ("system", "You are a research specialist. Provide comprehensive, accurate research with sources and insights."),
+                ("human", "{query}")
+            ]) | self.llm
+            self._analysis_chain = ChatPromptTemplate.from_messages([
+                ("system", "You are an analysis specialist. Provide detailed analysis, insights, and data-driven recommendations."),
+                ("human", "{query}")
+            ]) | self.llm
+            self._writing_chain = ChatPromptTemplate.from_messages([
+                ("system", "You are a writing specialist. Create clear, well-structured, engaging content with proper formatting."),
+                ("human", "{query}")
+            ]) | self.llm
+            self._synthesis_chain = ChatPromptTemplate.from_messages([
+                ("system", "Synthesize the agent responses into a coherent, comprehensive answer. Maintain the insights from each agent while creating a unified response."),
+                ("human", "{synthesis_prompt}")
+            ]) | self.llm
+        
+        # Initialize WandB - the system-metrics sampler periodically stalls
+        # the calling process, so turn it off along with console capture;
+        # WANDB_MODE lets batch deployments switch to offline logging and
+        # mock mode disables wandb outright since its metrics are synthetic
         self.wandb_run = wandb.init(
             project=project_name,
             config={
@@ -46,12 +176,31 @@ class ProductionMultiAgent:
                 "use_mock": use_mock,
                 "framework": "langgraph",
                 "mcp_enabled": True
-            }
+            },
+            mode="disabled" if use_mock else os.getenv("WANDB_MODE", "online"),
+            settings=wandb.Settings(_disable_stats=True, _disable_meta=True, console="off")
         )
+        # Skip even the serialize+enqueue cost of wandb.log when mocking
+        self._log = (lambda *args, **kwargs: None) if use_mock else wandb.log
         
         # Initialize Weave
         weave.init(f"{project_name}-weave")
         
+        # Reuse MCP sessions across queries instead of per-call setup.
+        # The pool is shared process-wide by default so constructing one
+        # agent per request does not multiply MCP setup cost; no_share
+        # opts back into a private pool for isolation
+        if no_share:
+            self._mcp_pool_key = None
+            self._mcp_pool = MCPSessionPool(mcp_server)
+        else:
+            self._mcp_pool_key, self._mcp_pool = acquire_shared_pool(
+                mcp_server, {"server": "default", "tools": sorted(mcp_server.tools)}
+            )
+
+        # Tool catalog comes from the on-disk discovery cache when available
+        self._tool_catalog = load_tool_catalog(mcp_server)
+
         self.graph = self._build_graph()
         self.session_stats = {
             "total_queries": 0,
@@ -73,19 +222,9 @@ class ProductionMultiAgent:
         workflow.add_node("mcp_executor", self.mcp_executor_node)
         workflow.add_node("synthesizer", self.synthesizer_node)
         
-        # Add edges
+        # Add edges - the coordinator fans out to every needed agent in parallel
         workflow.set_entry_point("coordinator")
-        workflow.add_conditional_edges(
-            "coordinator",
-            self.route_to_agents,
-            {
-                "research": "research_agent",
-                "analysis": "analysis_agent", 
-                "writing": "writing_agent",
-                "mcp_tools": "mcp_executor",
-                "synthesize": "synthesizer"
-            }
-        )
+        workflow.add_conditional_edges("coordinator", self.route_to_agents)
         
         # Agent to synthesizer edges
         workflow.add_edge("research_agent", "synthesizer")
@@ -101,71 +240,99 @@ class ProductionMultiAgent:
         """Coordinate and route tasks to appropriate agents"""
         messages = state["messages"]
         last_message = messages[-1].content if messages else ""
-        
-        # Log to WandB
-        wandb.log({
-            "coordinator/query_length": len(last_message),
-            "coordinator/timestamp": time.time()
-        })
-        
-        # Analyze task requirements
+
+        # Loop guard: hash the recent message tail and short-circuit to the
+        # synthesizer on a repeat, so a future retry edge cannot re-enter
+        # agents with an ever-growing history
+        tail = tuple(m.content for m in messages[-3:])
+        loop_hash = hashlib.blake2b(repr(tail).encode()).hexdigest()[:16]
+        if loop_hash in state.get("loop_hashes", []):
+            self._log({"coordinator/loop_detected": 1}, commit=False)
+            return {
+                "current_agent": "coordinator",
+                "task_analysis": {
+                    "route": "synthesizer",
+                    "agents_needed": ["synthesizer"],
+                    "tool_type": "none",
+                    "reasoning": "Repeated message tail detected - aborting retries"
+                },
+                "specialist_results": {
+                    "loop_guard": {
+                        "agent": "coordinator",
+                        "response": "Aborted after detecting a repeated agent loop; synthesizing partial results.",
+                        "status": "error",
+                        "timestamp": time.time()
+                    }
+                }
+            }
+
+        # Analyze task requirements - lower/tokenize once here and cache the
+        # results in state so downstream nodes skip their own string scans
         query_lower = last_message.lower()
-        
-        # Determine routing with enhanced logic
-        if any(op in query_lower for op in ["calculate", "+", "-", "*", "/", "math"]):
-            route = "mcp_tools"
-            agents_needed = ["mcp_executor"]
+        query_tokens = WORD_RE.findall(query_lower)
+        tokens = set(query_tokens)
+
+        # Collect every agent the query needs - multiple matches run in parallel
+        agents_needed = []
+        tool_type = None
+
+        if MATH_KEYS & tokens or any(op in query_lower for op in MATH_OPS):
+            agents_needed.append("mcp_executor")
             tool_type = "calculator"
-        elif "weather" in query_lower:
-            route = "mcp_tools"
-            agents_needed = ["mcp_executor"]
+        elif WEATHER_KEYS & tokens:
+            agents_needed.append("mcp_executor")
             tool_type = "weather"
-        elif "time" in query_lower:
-            route = "mcp_tools"
-            agents_needed = ["mcp_executor"]
+        elif TIME_KEYS & tokens:
+            agents_needed.append("mcp_executor")
             tool_type = "time"
-        elif any(word in query_lower for word in ["research", "find", "information", "search"]):
-            route = "research"
-            agents_needed = ["research_agent"]
-            tool_type = "research"
-        elif any(word in query_lower for word in ["analyze", "analysis", "insights", "examine"]):
-            route = "analysis"
-            agents_needed = ["analysis_agent"]
-            tool_type = "analysis"
-        elif any(word in query_lower for word in ["write", "document", "report", "create"]):
-            route = "writing"
-            agents_needed = ["writing_agent"]
-            tool_type = "writing"
-        else:
-            route = "research"
-            agents_needed = ["research_agent"]
+
+        if RESEARCH_KEYS & tokens:
+            agents_needed.append("research_agent")
+            tool_type = tool_type or "research"
+        if ANALYSIS_KEYS & tokens:
+            agents_needed.append("analysis_agent")
+            tool_type = tool_type or "analysis"
+        if WRITING_KEYS & tokens:
+            agents_needed.append("writing_agent")
+            tool_type = tool_type or "writing"
+
+        if not agents_needed:
+            agents_needed.append("research_agent")
             tool_type = "general"
-        
+
+        route = agents_needed[0]
+
         task_analysis = {
             "route": route,
             "agents_needed": agents_needed,
             "tool_type": tool_type,
-            "reasoning": f"Routing to {route} based on query analysis",
-            "query_classification": self._classify_query_complexity(last_message)
+            "reasoning": f"Fanning out to {', '.join(agents_needed)} based on query analysis",
+            "query_classification": self._classify_query_complexity(last_message, query_tokens)
         }
         
-        # Log routing decision to WandB
-        wandb.log({
+        # Accumulate coordinator metrics in one batched row, flushed per query
+        self._log({
+            "coordinator/query_length": len(last_message),
             "coordinator/route": route,
             "coordinator/tool_type": tool_type,
             "coordinator/query_complexity": task_analysis["query_classification"]["complexity"]
-        })
+        }, commit=False)
         
+        # Return only the delta - LangGraph merges partial updates, and
+        # re-spreading state would replay messages through the add reducer
         return {
-            **state,
             "current_agent": "coordinator",
+            "query_lower": query_lower,
+            "query_tokens": query_tokens,
+            "loop_hashes": [loop_hash],
             "task_analysis": task_analysis
         }
     
-    def _classify_query_complexity(self, query: str) -> Dict[str, Any]:
+    def _classify_query_complexity(self, query: str, tokens: Optional[List[str]] = None) -> Dict[str, Any]:
         """Classify query complexity for better routing"""
-        word_count = len(query.split())
-        has_multiple_tasks = len([w for w in ["and", "also", "then", "after"] if w in query.lower()]) > 0
+        word_count = len(tokens if tokens is not None else query.split())
+        # One regex pass; re.I avoids allocating a lowered copy of the query
+        has_multiple_tasks = bool(MULTI_TASK_RE.search(query))
         
         if word_count < 5:
             complexity = "simple"
@@ -180,12 +347,12 @@ class ProductionMultiAgent:
             "has_multiple_tasks": has_multiple_tasks
         }
     
-    def route_to_agents(self, state: AgentState) -> str:
-        """Route to appropriate agent based on task analysis"""
-        return state["task_analysis"]["route"]
+    def route_to_agents(self, state: AgentState) -> List[Send]:
+        """Fan out to every agent the coordinator selected"""
+        return [Send(agent, state) for agent in state["task_analysis"]["agents_needed"]]
     
     @weave.op()
-    def research_agent_node(self, state: AgentState) -> AgentState:
+    async def research_agent_node(self, state: AgentState) -> AgentState:
         """Research specialist agent with WandB tracking"""
         messages = state["messages"]
         query = messages[-1].content if messages else ""
@@ -195,41 +362,31 @@ class ProductionMultiAgent:
         if self.use_mock:
             response = f"Research Agent: Comprehensive research on '{query[:50]}...' completed with detailed findings."
         else:
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", "You are a research specialist. Provide comprehensive, accurate research with sources and insights."),
-                ("human", "{query}")
-            ])
-            chain = prompt | self.llm
-            response = chain.invoke({"query": query}).content
+            response = (await self._research_chain.ainvoke({"query": query})).content
         
         processing_time = time.time() - start_time
         
         # Log to WandB
-        wandb.log({
+        self._log({
             "research_agent/processing_time": processing_time,
-            "research_agent/response_length": len(response),
-            "research_agent/timestamp": time.time()
-        })
+            "research_agent/response_length": len(response)
+        }, commit=False)
         
         result = {
             "agent": "research",
-            "response": response,
+            "response_ref": response_store.put(response),
             "processing_time": processing_time,
             "timestamp": time.time()
         }
         
-        specialist_results = state.get("specialist_results", {})
-        specialist_results["research"] = result
-        
+        # Return only this branch's delta - parallel branches merge via reducers
         return {
-            **state,
-            "current_agent": "research_agent",
-            "specialist_results": specialist_results,
-            "messages": state["messages"] + [AIMessage(content=response)]
+            "specialist_results": {"research": result},
+            "messages": [AIMessage(content=response)]
         }
     
     @weave.op()
-    def analysis_agent_node(self, state: AgentState) -> AgentState:
+    async def analysis_agent_node(self, state: AgentState) -> AgentState:
         """Analysis specialist agent with WandB tracking"""
         messages = state["messages"]
         query = messages[-1].content if messages else ""
@@ -239,41 +396,30 @@ class ProductionMultiAgent:
         if self.use_mock:
             response = f"Analysis Agent: Deep analysis of '{query[:50]}...' with statistical insights and recommendations."
         else:
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", "You are an analysis specialist. Provide detailed analysis, insights, and data-driven recommendations."),
-                ("human", "{query}")
-            ])
-            chain = prompt | self.llm
-            response = chain.invoke({"query": query}).content
+            response = (await self._analysis_chain.ainvoke({"query": query})).content
         
         processing_time = time.time() - start_time
         
         # Log to WandB
-        wandb.log({
+        self._log({
             "analysis_agent/processing_time": processing_time,
-            "analysis_agent/response_length": len(response),
-            "analysis_agent/timestamp": time.time()
-        })
+            "analysis_agent/response_length": len(response)
+        }, commit=False)
         
         result = {
             "agent": "analysis",
-            "response": response,
+            "response_ref": response_store.put(response),
             "processing_time": processing_time,
             "timestamp": time.time()
         }
         
-        specialist_results = state.get("specialist_results", {})
-        specialist_results["analysis"] = result
-        
         return {
-            **state,
-            "current_agent": "analysis_agent",
-            "specialist_results": specialist_results,
-            "messages": state["messages"] + [AIMessage(content=response)]
+            "specialist_results": {"analysis": result},
+            "messages": [AIMessage(content=response)]
         }
     
     @weave.op()
-    def writing_agent_node(self, state: AgentState) -> AgentState:
+    async def writing_agent_node(self, state: AgentState) -> AgentState:
         """Writing specialist agent with WandB tracking"""
         messages = state["messages"]
         query = messages[-1].content if messages else ""
@@ -283,37 +429,26 @@ class ProductionMultiAgent:
         if self.use_mock:
             response = f"Writing Agent: Well-structured document created for '{query[:50]}...' with clear formatting and flow."
         else:
-            prompt = ChatPromptTemplate.from_messages([
-                ("system", "You are a writing specialist. Create clear, well-structured, engaging content with proper formatting."),
-                ("human", "{query}")
-            ])
-            chain = prompt | self.llm
-            response = chain.invoke({"query": query}).content
+            response = (await self._writing_chain.ainvoke({"query": query})).content
         
         processing_time = time.time() - start_time
         
         # Log to WandB
-        wandb.log({
+        self._log({
             "writing_agent/processing_time": processing_time,
-            "writing_agent/response_length": len(response),
-            "writing_agent/timestamp": time.time()
-        })
+            "writing_agent/response_length": len(response)
+        }, commit=False)
         
         result = {
             "agent": "writing",
-            "response": response,
+            "response_ref": response_store.put(response),
             "processing_time": processing_time,
             "timestamp": time.time()
         }
         
-        specialist_results = state.get("specialist_results", {})
-        specialist_results["writing"] = result
-        
         return {
-            **state,
-            "current_agent": "writing_agent",
-            "specialist_results": specialist_results,
-            "messages": state["messages"] + [AIMessage(content=response)]
+            "specialist_results": {"writing": result},
+            "messages": [AIMessage(content=response)]
         }
     
     @weave.op()
@@ -323,79 +458,85 @@ class ProductionMultiAgent:
         query = messages[-1].content if messages else ""
         
         start_time = time.time()
-        query_lower = query.lower()
+        # Reuse the token bundle the coordinator cached in state
+        query_lower = state.get("query_lower") or query.lower()
+        token_set = set(state.get("query_tokens") or WORD_RE.findall(query_lower))
         tool_results = {}
         tools_used = []
         
-        # Determine and execute appropriate MCP tools
-        if any(op in query_lower for op in ["calculate", "+", "-", "*", "/", "math"]):
-            import re
-            match = re.search(r'[\d+\-*/().\s]+', query)
+        # Collect every applicable MCP tool instead of stopping at the first match
+        calls = []
+        if MATH_KEYS & token_set or any(op in query_lower for op in MATH_OPS):
+            match = CALC_RE.search(query)
             expression = match.group(0).strip() if match else query
-            result = await call_mcp_tool("calculator", expression=expression)
-            tool_results["calculator"] = result
-            tools_used.append("calculator")
-            
-        elif "weather" in query_lower:
+            calls.append(("calculator", {"expression": expression}))
+        if "weather" in query_lower:
             # Extract location or use default
             location = self._extract_location(query) or "New York"
-            result = await call_mcp_tool("weather", location=location)
-            tool_results["weather"] = result
-            tools_used.append("weather")
-            
-        elif "time" in query_lower:
-            result = await call_mcp_tool("time")
-            tool_results["time"] = result
-            tools_used.append("time")
-            
-        else:
-            result = await call_mcp_tool("research", query=query, depth="detailed")
-            tool_results["research"] = result
-            tools_used.append("research")
+            calls.append(("weather", {"location": location}))
+        if "time" in query_lower:
+            calls.append(("time", {}))
+        if not calls:
+            calls.append(("research", {"query": query, "depth": "detailed"}))
+
+        # Dispatch concurrently so total wall time is max, not sum, of latencies
+        async with self._mcp_pool.acquire() as session:
+            results = await asyncio.gather(
+                *(session.call_tool(name, params) for name, params in calls),
+                return_exceptions=True
+            )
+
+        for (name, _), result in zip(calls, results):
+            if isinstance(result, Exception):
+                result = {"tool": name, "error": str(result), "status": "error"}
+            tool_results[name] = result
+            tools_used.append(name)
         
         processing_time = time.time() - start_time
         
         # Log to WandB
-        wandb.log({
+        self._log({
             "mcp_executor/processing_time": processing_time,
             "mcp_executor/tools_used": len(tools_used),
-            "mcp_executor/tools_list": tools_used,
-            "mcp_executor/timestamp": time.time()
-        })
+            "mcp_executor/tools_list": tools_used
+        }, commit=False)
         
         # Update session stats
         for tool in tools_used:
             self.session_stats["tools_used"][tool] = self.session_stats["tools_used"].get(tool, 0) + 1
         
-        specialist_results = state.get("specialist_results", {})
-        specialist_results["mcp_tools"] = {
+        # Encode once and share between the message and the result record
+        encoded_results = _pretty(tool_results)
+        mcp_result = {
             "agent": "mcp_executor",
-            "response": json.dumps(tool_results, indent=2),
+            "response_ref": response_store.put(encoded_results),
             "tool_results": tool_results,
             "tools_used": tools_used,
             "processing_time": processing_time,
             "timestamp": time.time()
         }
-        
+
         return {
-            **state,
-            "current_agent": "mcp_executor",
-            "specialist_results": specialist_results,
+            "specialist_results": {"mcp_tools": mcp_result},
             "tools_used": tools_used,
-            "messages": state["messages"] + [AIMessage(content=json.dumps(tool_results, indent=2))]
+            "messages": [AIMessage(content=encoded_results)]
         }
     
     def _extract_location(self, query: str) -> Optional[str]:
-        """Extract location from query (simplified)"""
-        # Simple location extraction - in production, use NER
+        """Extract a location phrase from the query"""
+        match = LOC_RE.search(query)
+        if match:
+            return match.group(1).strip(".,!?")
+
+        # Fallback for lower-cased queries: single token after in/for/at
         words = query.split()
         for i, word in enumerate(words):
-            if word.lower() in ["in", "for", "at"] and i + 1 < len(words):
+            if word.lower() in ("in", "for", "at") and i + 1 < len(words):
                 return words[i + 1].strip(".,!?")
         return None
     
     @weave.op()
-    def synthesizer_node(self, state: AgentState) -> AgentState:
+    async def synthesizer_node(self, state: AgentState) -> AgentState:
         """Synthesize results with comprehensive tracking"""
         specialist_results = state.get("specialist_results", {})
         
@@ -404,44 +545,36 @@ class ProductionMultiAgent:
         if len(specialist_results) == 1 and "mcp_tools" in specialist_results:
             # Simple tool response
             tool_result = specialist_results["mcp_tools"]["tool_results"]
-            final_response = f"Results:\n{json.dumps(tool_result, indent=2)}"
+            final_response = f"Results:\n{_pretty(tool_result)}"
         else:
             # Multi-agent synthesis
             agents_used = list(specialist_results.keys())
-            responses = [result["response"] for result in specialist_results.values()]
             
             if self.use_mock:
                 final_response = f"Synthesized insights from {', '.join(agents_used)} agents: Combined analysis and recommendations based on multi-agent collaboration."
             else:
                 synthesis_prompt = "Synthesize these agent responses into a coherent, comprehensive answer:\n\n"
                 for agent, result in specialist_results.items():
-                    synthesis_prompt += f"**{agent.upper()}**: {result['response']}\n\n"
+                    synthesis_prompt += f"**{agent.upper()}**: {_resolve_response(result)}\n\n"
                 
-                prompt = ChatPromptTemplate.from_messages([
-                    ("system", "Synthesize the agent responses into a coherent, comprehensive answer. Maintain the insights from each agent while creating a unified response."),
-                    ("human", "{synthesis_prompt}")
-                ])
-                chain = prompt | self.llm
-                final_response = chain.invoke({"synthesis_prompt": synthesis_prompt}).content
+                final_response = (await self._synthesis_chain.ainvoke({"synthesis_prompt": synthesis_prompt})).content
         
         processing_time = time.time() - start_time
         
         # Log synthesis to WandB
-        wandb.log({
+        self._log({
             "synthesizer/processing_time": processing_time,
             "synthesizer/agents_involved": len(specialist_results),
-            "synthesizer/final_response_length": len(final_response),
-            "synthesizer/timestamp": time.time()
-        })
+            "synthesizer/final_response_length": len(final_response)
+        }, commit=False)
         
         return {
-            **state,
             "current_agent": "synthesizer",
-            "messages": state["messages"] + [AIMessage(content=final_response)]
+            "messages": [AIMessage(content=final_response)]
         }
     
     @weave.op()
-    def process_query(self, query: str) -> Dict[str, Any]:
+    async def process_query(self, query: str) -> Dict[str, Any]:
         """Process query through multi-agent workflow with comprehensive tracking"""
         start_time = time.time()
         
@@ -453,15 +586,18 @@ class ProductionMultiAgent:
             initial_state = AgentState(
                 messages=[HumanMessage(content=query)],
                 current_agent="",
+                query_lower="",
+                query_tokens=[],
                 task_analysis={},
                 specialist_results={},
                 tools_used=[],
+                loop_hashes=[],
                 processing_time=0.0,
                 wandb_run_id=self.wandb_run.id
             )
             
             # Execute workflow
-            final_state = self.graph.invoke(initial_state)
+            final_state = await self.graph.ainvoke(initial_state)
             
             processing_time = time.time() - start_time
             self.session_stats["total_processing_time"] += processing_time
@@ -470,21 +606,27 @@ class ProductionMultiAgent:
             for agent in final_state.get("specialist_results", {}).keys():
                 self.session_stats["agents_used"][agent] = self.session_stats["agents_used"].get(agent, 0) + 1
             
+            # Inline stored responses so callers keep the old result shape
+            specialist_results = {
+                name: {**record, "response": _resolve_response(record)}
+                for name, record in final_state.get("specialist_results", {}).items()
+            }
+            
             result = {
                 "query": query,
                 "task_analysis": final_state.get("task_analysis", {}),
-                "specialist_results": final_state.get("specialist_results", {}),
+                "specialist_results": specialist_results,
                 "tools_used": final_state.get("tools_used", []),
                 "final_response": final_state["messages"][-1].content,
                 "processing_time": processing_time,
-                "agents_used": list(final_state.get("specialist_results", {}).keys()),
+                "agents_used": list(specialist_results.keys()),
                 "message_history": [msg.content for msg in final_state["messages"]],
                 "wandb_run_id": self.wandb_run.id,
                 "timestamp": datetime.now().isoformat()
             }
             
-            # Log comprehensive metrics to WandB
-            wandb.log({
+            # Flush the per-node metrics accumulated with commit=False in one row
+            self._log({
                 "query/processing_time": processing_time,
                 "query/agents_count": len(result["agents_used"]),
                 "query/tools_count": len(result["tools_used"]),
@@ -492,7 +634,7 @@ class ProductionMultiAgent:
                 "query/success": True,
                 "session/total_queries": self.session_stats["total_queries"],
                 "session/avg_processing_time": self.session_stats["total_processing_time"] / self.session_stats["total_queries"]
-            })
+            }, commit=True)
             
             return result
             
@@ -500,13 +642,13 @@ class ProductionMultiAgent:
             self.session_stats["errors"] += 1
             processing_time = time.time() - start_time
             
-            # Log error to WandB
-            wandb.log({
+            # Log error to WandB, flushing anything accumulated before the failure
+            self._log({
                 "query/processing_time": processing_time,
                 "query/success": False,
                 "query/error": str(e),
                 "session/errors": self.session_stats["errors"]
-            })
+            }, commit=True)
             
             return {
                 "query": query,
@@ -515,6 +657,15 @@ class ProductionMultiAgent:
                 "timestamp": datetime.now().isoformat()
             }
     
+    def process_query_sync(self, query: str) -> Dict[str, Any]:
+        """Synchronous entry point for non-async callers
+
+        Submits to the shared event-loop thread instead of asyncio.run,
+        so every query reuses one loop and the pooled MCP sessions bound
+        to it survive across calls and threads.
+        """
+        return get_shared_loop().submit(self.process_query(query)).result()
+
     def get_session_stats(self) -> Dict[str, Any]:
         """Get comprehensive session statistics"""
         return {
@@ -526,12 +677,17 @@ class ProductionMultiAgent:
     def close(self):
         """Clean up resources"""
         # Log final session stats
-        wandb.log({
+        self._log({
             "session/final_total_queries": self.session_stats["total_queries"],
             "session/final_total_time": self.session_stats["total_processing_time"],
             "session/final_errors": self.session_stats["errors"]
         })
         
+        # Drop this instance's reference to the shared MCP session pool
+        if self._mcp_pool_key is not None:
+            release_shared_pool(self._mcp_pool_key)
+            self._mcp_pool_key = None
+        
         wandb.finish()
 
 # Factory function
@@ -8,13 +8,19 @@ import streamlit as st
 import sys
 import os
 from dotenv import load_dotenv
+import asyncio
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import plotly.express as px
-import plotly.graph_objects as go
 import pandas as pd
 import json
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 # Load environment
 load_dotenv()
 
@@ -32,14 +38,44 @@ class MockWeave:
 
 sys.modules['weave'] = MockWeave()
 
-# Import all production components
-from agent.core import WeaveAgent
-from agent.memory import MemoryManager
-from agent.tools import ToolRegistry
-from evaluation.evaluators import ResponseQualityEvaluator, ToolUsageEvaluator
-from evaluation.scorers import WeaveScorers
-from monitoring.monitors import MonitoringDashboard
-from multi_agent.workflow import MultiAgentWorkflow
+# Production components are imported lazily inside the factories below
+# so cold start only loads what the visited page actually needs
+def _make_agent():
+    from agent.core import WeaveAgent
+    return WeaveAgent(use_mock=False)
+
+def _make_memory():
+    from agent.memory import MemoryManager
+    return MemoryManager()
+
+def _make_tools():
+    from agent.tools import ToolRegistry
+    return ToolRegistry()
+
+def _make_quality_evaluator():
+    from evaluation.evaluators import ResponseQualityEvaluator
+    return ResponseQualityEvaluator()
+
+def _make_tool_evaluator():
+    from evaluation.evaluators import ToolUsageEvaluator
+    return ToolUsageEvaluator()
+
+def _make_weave_scorers():
+    from evaluation.scorers import WeaveScorers
+    return WeaveScorers()
+
+def _make_dashboard():
+    from monitoring.monitors import MonitoringDashboard
+    return MonitoringDashboard()
+
+def _make_multi_agent():
+    from multi_agent.workflow import MultiAgentWorkflow
+    return MultiAgentWorkflow()
+
+# Nested agent runs go through worker threads so the event loops they
+# start stay isolated from Streamlit's script thread (no loop conflicts,
+# and the script thread stays responsive)
+_AGENT_EXECUTOR = ThreadPoolExecutor(max_workers=8)
 
 # Page configuration
 st.set_page_config(
@@ -49,30 +85,241 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+def lttb(x, y, n_out=500):
+    """Largest-Triangle-Three-Buckets downsampling
+
+    Caps the points handed to Plotly while keeping the visual shape of
+    the series, so render cost stays bounded as history grows.
+    """
+    n = len(x)
+    if n <= n_out:
+        return list(x), list(y)
+    
+    sampled_x = [x[0]]
+    sampled_y = [y[0]]
+    bucket_size = (n - 2) / (n_out - 2)
+    a = 0
+    
+    for i in range(n_out - 2):
+        start = int(i * bucket_size) + 1
+        end = min(int((i + 1) * bucket_size) + 1, n - 1)
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        span = max(next_end - next_start, 1)
+        avg_x = sum(x[next_start:next_end]) / span
+        avg_y = sum(y[next_start:next_end]) / span
+        
+        # Keep the point forming the largest triangle with the previous
+        # kept point and the next bucket's average
+        best = start
+        best_area = -1.0
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best_area = area
+                best = j
+        sampled_x.append(x[best])
+        sampled_y.append(y[best])
+        a = best
+    
+    sampled_x.append(x[-1])
+    sampled_y.append(y[-1])
+    return sampled_x, sampled_y
+
+# Figure builders are cached on their input data so Streamlit reruns
+# skip Plotly trace construction whenever the data has not changed
+def _plot_keyed(fig, key):
+    """Render a chart under a stable widget key
+
+    A stable key preserves element identity across reruns, so the
+    frontend patches the existing chart in place instead of remounting
+    it, and Streamlit's forward-message cache can skip re-sending
+    payloads for figures whose data has not changed (the cached builders
+    return the identical figure object in that case).
+    """
+    st.plotly_chart(fig, use_container_width=True, key=key)
+
+@st.cache_data(show_spinner=False)
+def _sidebar_trend_fig(times):
+    import plotly.express as px
+    fig = px.line(y=list(times), title="Response Time Trend")
+    fig.update_layout(height=200, showlegend=False)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _quality_by_category_fig(df):
+    import plotly.express as px
+    return px.bar(df, x='Category', y='Quality Score',
+                  title="Quality Scores by Category",
+                  color='Quality Score',
+                  color_continuous_scale='viridis')
+
+@st.cache_data(show_spinner=False)
+def _evaluation_detail_fig(df):
+    # One subplot figure means one serialization and one websocket frame
+    # instead of a separate st.plotly_chart per panel; Scattergl keeps
+    # the scatter on the GPU at scale
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    fig = make_subplots(rows=1, cols=2,
+                        subplot_titles=("Quality vs Performance", "Quality Dimensions"))
+    for category, group in df.groupby('Category'):
+        fig.add_trace(go.Scattergl(x=group['Response Time'], y=group['Quality Score'],
+                                   mode='markers', name=category), row=1, col=1)
+    for metric in ('Relevance', 'Coherence', 'Completeness'):
+        fig.add_trace(go.Bar(x=df['Category'], y=df[metric], name=metric), row=1, col=2)
+    fig.update_layout(barmode='group')
+    fig.update_xaxes(title_text='Response Time', row=1, col=1)
+    fig.update_yaxes(title_text='Quality Score', row=1, col=1)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _monitoring_overview_fig(df):
+    # Trend (LTTB-downsampled, WebGL) and quality histogram share one
+    # figure so the page sends a single chart payload to the browser
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    fig = make_subplots(rows=1, cols=2,
+                        subplot_titles=("Response Time Trend", "Quality Score Distribution"))
+    x, y = lttb(df['Interaction'].tolist(), df['Response Time'].tolist())
+    fig.add_trace(go.Scattergl(x=x, y=y, mode='lines+markers'), row=1, col=1)
+    fig.add_hline(y=df['Response Time'].mean(),
+                  line_dash="dash",
+                  annotation_text="Average", row=1, col=1)
+    fig.add_trace(go.Histogram(x=df['Quality Score'], nbinsx=10), row=1, col=2)
+    fig.update_layout(showlegend=False)
+    fig.update_xaxes(title_text='Interaction', row=1, col=1)
+    fig.update_yaxes(title_text='Response Time', row=1, col=1)
+    return fig
+
+class ProductionSystem:
+    """Lazy facade over the production components
+
+    st.cache_resource walks the cached object's graph at the end of every
+    script run, so the cached object stays tiny: each component is built
+    on first access instead of eagerly at startup, and pages that never
+    touch a component never pay for it.
+    """
+    
+    _FACTORIES = {
+        'agent': _make_agent,
+        'memory': _make_memory,
+        'tools': _make_tools,
+        'quality_evaluator': _make_quality_evaluator,
+        'tool_evaluator': _make_tool_evaluator,
+        'weave_scorers': _make_weave_scorers,
+        'dashboard': _make_dashboard,
+        'multi_agent': _make_multi_agent
+    }
+    
+    def __init__(self):
+        self._components = {}
+    
+    def __getitem__(self, name):
+        if name not in self._components:
+            self._components[name] = self._FACTORIES[name]()
+        return self._components[name]
+
+# Static content for the system-status page, hoisted to module scope so
+# the cached builders below get stable hash keys
+_STATUS_COMPONENTS = [
+    {"Component": "WeaveAgent", "Status": "🟢 Active", "Version": "1.0.0", "Last Check": "Just now"},
+    {"Component": "MemoryManager", "Status": "🟢 Active", "Version": "1.0.0", "Last Check": "Just now"},
+    {"Component": "ToolRegistry", "Status": "🟢 Active", "Version": "1.0.0", "Last Check": "Just now"},
+    {"Component": "QualityEvaluator", "Status": "🟢 Active", "Version": "1.0.0", "Last Check": "Just now"},
+    {"Component": "MonitoringDashboard", "Status": "🟢 Active", "Version": "1.0.0", "Last Check": "Just now"},
+    {"Component": "MultiAgentWorkflow", "Status": "🟢 Active", "Version": "1.0.0", "Last Check": "Just now"},
+    {"Component": "OpenAI Integration", "Status": "🟢 Connected", "Version": "GPT-4o-mini", "Last Check": "Just now"}
+]
+
+_SYSTEM_CONFIG = {
+    "Environment": "Production Demo",
+    "OpenAI Model": "gpt-4o-mini",
+    "Max Tokens": "1500",
+    "Memory Window": "1000 interactions",
+    "Monitoring Window": "100 samples",
+    "Weave Integration": "Mock (Production Ready)",
+    "Error Handling": "Enabled",
+    "Logging Level": "INFO"
+}
+
+@st.cache_data(persist="disk", show_spinner=False)
+def _components_df():
+    # This table never changes at runtime; persisting to disk means even
+    # a fresh worker serves it without rebuilding the DataFrame
+    return pd.DataFrame(_STATUS_COMPONENTS)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _status_hist_fig(times):
+    # Bin server-side so the figure carries 10 bar heights instead of
+    # every raw sample; payload stays O(bins) as history grows. Tuple
+    # key lets Streamlit hash the series and skip rebuilds on reruns.
+    import numpy as np
+    import plotly.graph_objects as go
+    counts, edges = np.histogram(times, bins=10)
+    centers = (edges[:-1] + edges[1:]) / 2
+    fig = go.Figure(go.Bar(x=centers, y=counts, width=np.diff(edges)))
+    fig.update_layout(title="Response Time Distribution",
+                      xaxis_title='Response Time', yaxis_title='Count')
+    return fig
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _status_trend_fig(scores):
+    # Downsample long series so the browser payload stays bounded no
+    # matter how much interaction history accumulates; Scattergl keeps
+    # rendering on the GPU and markers drop once they would just overlap
+    x, y = lttb(list(range(len(scores))), list(scores))
+    import plotly.graph_objects as go
+    mode = 'lines+markers' if len(scores) < 500 else 'lines'
+    fig = go.Figure(go.Scattergl(x=x, y=y, mode=mode))
+    # Hover bookkeeping is per source point; switch it off once the
+    # series is long enough that individual points stop being meaningful
+    fig.update_layout(title="Quality Score Trend", showlegend=False,
+                      hovermode='x' if len(scores) < 50_000 else False,
+                      spikedistance=0)
+    return fig
+
+def _trace_payload(trace_dict):
+    # One serialization per button press; orjson is 2-10x faster than
+    # the stdlib encoder st.json would run on the same dict
+    if orjson is not None:
+        return orjson.dumps(trace_dict, option=orjson.OPT_INDENT_2,
+                            default=str).decode()
+    return json.dumps(trace_dict, indent=2, default=str)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_process(_agent, prompt):
+    """Memoized agent.process so repeat demo prompts skip the LLM
+
+    The underscore keeps Streamlit from trying to hash the agent; the
+    prompt is the cache key. Interactive chat stays uncached on purpose.
+    """
+    return _agent.process(prompt)
+
 @st.cache_resource
 def initialize_production_system():
-    """Initialize production system components"""
-    return {
-        'agent': WeaveAgent(use_mock=False),
-        'memory': MemoryManager(),
-        'tools': ToolRegistry(),
-        'quality_evaluator': ResponseQualityEvaluator(),
-        'tool_evaluator': ToolUsageEvaluator(),
-        'weave_scorers': WeaveScorers(),
-        'dashboard': MonitoringDashboard(),
-        'multi_agent': MultiAgentWorkflow()
-    }
+    """Initialize the production system facade (components build lazily)"""
+    return ProductionSystem()
 
 def main():
     # Initialize system
     if 'system' not in st.session_state:
         st.session_state.system = initialize_production_system()
-        st.session_state.interaction_history = []
+        # Bounded so session state stops growing (and re-serializing)
+        # linearly with session length
+        st.session_state.interaction_history = deque(maxlen=500)
+        # Columnar mirror of the history for vectorized sidebar rollups
+        st.session_state.history_df = pd.DataFrame(columns=['processing_time', 'quality_score'])
         st.session_state.metrics = {
             'total_queries': 0,
             'avg_response_time': 0.0,
             'avg_quality_score': 0.0,
-            'success_rate': 1.0
+            'success_rate': 1.0,
+            # Running sums so averages update in O(1) per interaction
+            'sum_response_time': 0.0,
+            'sum_quality_score': 0.0
         }
     
     # Header
@@ -119,20 +366,17 @@ def main():
         show_monitoring = st.checkbox("Show Performance Monitoring", value=True)
         
         st.header("📊 Live System Metrics")
-        if st.session_state.interaction_history:
-            recent_interactions = st.session_state.interaction_history[-10:]
-            avg_time = sum(i['processing_time'] for i in recent_interactions) / len(recent_interactions)
-            avg_quality = sum(i['quality_score'] for i in recent_interactions) / len(recent_interactions)
+        if len(st.session_state.history_df):
+            recent = st.session_state.history_df.tail(10)
+            means = recent.mean()
             
-            st.metric("Recent Avg Time", f"{avg_time:.2f}s")
-            st.metric("Recent Avg Quality", f"{avg_quality:.2f}")
+            st.metric("Recent Avg Time", f"{means['processing_time']:.2f}s")
+            st.metric("Recent Avg Quality", f"{means['quality_score']:.2f}")
             
             # Mini performance chart
-            if len(recent_interactions) > 1:
-                times = [i['processing_time'] for i in recent_interactions]
-                fig = px.line(y=times, title="Response Time Trend")
-                fig.update_layout(height=200, showlegend=False)
-                st.plotly_chart(fig, use_container_width=True)
+            if len(recent) > 1:
+                times = tuple(recent['processing_time'])
+                _plot_keyed(_sidebar_trend_fig(times), key='sidebar_trend')
     
     # Main content routing
     if "Overview" in demo_mode:
@@ -223,9 +467,10 @@ def show_tracing_system():
             with st.spinner("Processing with comprehensive tracing..."):
                 start_time = time.time()
                 
-                # Execute with agent
+                # Execute with agent (memoized - the default demo query
+                # renders instantly on repeat clicks)
                 agent = st.session_state.system['agent']
-                result = agent.process(trace_query)
+                result = cached_process(agent, trace_query)
                 
                 # Evaluate
                 evaluator = st.session_state.system['quality_evaluator']
@@ -266,14 +511,15 @@ def show_tracing_system():
                 
                 # Show full trace data
                 with st.expander("🔍 Complete Trace Data"):
-                    st.json({
-                        "trace_id": f"trace_{int(time.time())}",
+                    trace_id = f"trace_{int(time.time())}"
+                    st.code(_trace_payload({
+                        "trace_id": trace_id,
                         "query": trace_query,
                         "execution_steps": trace_steps,
                         "agent_result": result,
                         "quality_metrics": quality_metrics,
                         "total_processing_time": processing_time
-                    })
+                    }), language='json')
     
     with col2:
         st.subheader("🎯 Tracing Benefits")
@@ -312,44 +558,75 @@ def show_evaluation_system():
             ("Analyze market trends for electric vehicles", "Complex Analysis")
         ]
         
-        results = []
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        for i, (query, category) in enumerate(test_cases):
-            status_text.text(f"Evaluating {category}: {query[:50]}...")
+        agent = st.session_state.system['agent']
+        quality_evaluator = st.session_state.system['quality_evaluator']
+        tool_evaluator = st.session_state.system['tool_evaluator']
+        available_tools = st.session_state.system['tools'].list_tools()
+        
+        # Run all test cases concurrently - wall time becomes the slowest
+        # case rather than the sum of all five LLM round-trips
+        async def run_suite():
+            semaphore = asyncio.Semaphore(4)
+            completed = [0]
             
-            # Process with agent
-            agent = st.session_state.system['agent']
-            result = agent.process(query)
+            async def run_one(query, category):
+                async with semaphore:
+                    result = await agent.aprocess(query)
+                    tool_metrics = await asyncio.to_thread(
+                        tool_evaluator.evaluate,
+                        query, result['selected_tools'], result['tool_results'],
+                        available_tools
+                    )
+                
+                completed[0] += 1
+                progress_bar.progress(completed[0] / (len(test_cases) + 1))
+                status_text.text(f"Processed {category}: {query[:50]}...")
+                return result, tool_metrics
             
-            # Comprehensive evaluation
-            quality_evaluator = st.session_state.system['quality_evaluator']
-            tool_evaluator = st.session_state.system['tool_evaluator']
+            processed = await asyncio.gather(*(run_one(q, c) for q, c in test_cases))
             
-            quality_metrics = quality_evaluator.evaluate(query, result['response'])
-            tool_metrics = tool_evaluator.evaluate(
-                query, result['selected_tools'], result['tool_results'], 
-                st.session_state.system['tools'].list_tools()
+            # One batched judge call scores every response - a single
+            # round-trip instead of two per test case
+            status_text.text("Scoring responses...")
+            quality_list = await quality_evaluator.aevaluate_batch(
+                [(query, result['response'])
+                 for (query, _), (result, _) in zip(test_cases, processed)]
             )
+            progress_bar.progress(1.0)
             
-            # Calculate overall scores
-            overall_quality = sum(quality_metrics.values()) / len(quality_metrics)
-            overall_tool_score = sum(tool_metrics.values()) / len(tool_metrics)
-            
-            results.append({
-                'Query': query[:50] + "..." if len(query) > 50 else query,
-                'Category': category,
-                'Quality Score': overall_quality,
-                'Tool Score': overall_tool_score,
-                'Response Time': result['processing_time'],
-                'Tools Used': len(result['selected_tools']),
-                'Relevance': quality_metrics.get('relevance', 0),
-                'Coherence': quality_metrics.get('coherence', 0),
-                'Completeness': quality_metrics.get('completeness', 0)
-            })
-            
-            progress_bar.progress((i + 1) / len(test_cases))
+            rows = []
+            for (query, category), (result, tool_metrics), quality_metrics in zip(
+                    test_cases, processed, quality_list):
+                # Calculate overall scores
+                overall_quality = sum(quality_metrics.values()) / len(quality_metrics)
+                overall_tool_score = sum(tool_metrics.values()) / len(tool_metrics)
+                
+                rows.append({
+                    'Query': query[:50] + "..." if len(query) > 50 else query,
+                    'Category': category,
+                    'Quality Score': overall_quality,
+                    'Tool Score': overall_tool_score,
+                    'Response Time': result['processing_time'],
+                    'Tools Used': len(result['selected_tools']),
+                    'Relevance': quality_metrics.get('relevance', 0),
+                    'Coherence': quality_metrics.get('coherence', 0),
+                    'Completeness': quality_metrics.get('completeness', 0)
+                })
+            return rows
+        
+        # The suite reuses the same five prompts; reuse the previous run's
+        # results instead of re-hitting the LLM on every button click
+        suite_key = tuple(query for query, _ in test_cases)
+        cached_suite = st.session_state.get('_eval_suite_cache')
+        if cached_suite and cached_suite[0] == suite_key:
+            results = cached_suite[1]
+            progress_bar.progress(1.0)
+        else:
+            results = list(asyncio.run(run_suite()))
+            st.session_state._eval_suite_cache = (suite_key, results)
         
         status_text.text("✅ Evaluation Complete!")
         
@@ -369,28 +646,21 @@ def show_evaluation_system():
             categories = df['Category'].tolist()
             quality_scores = df['Quality Score'].tolist()
             
-            fig = px.bar(df, x='Category', y='Quality Score', 
-                        title="Quality Scores by Category",
-                        color='Quality Score',
-                        color_continuous_scale='viridis')
-            st.plotly_chart(fig, use_container_width=True)
+            _plot_keyed(_quality_by_category_fig(df[['Category', 'Quality Score']]), key='eval_quality_by_category')
         
         # Detailed metrics
         st.subheader("🔍 Detailed Quality Metrics")
         
-        col1, col2, col3 = st.columns(3)
+        col1, col2 = st.columns([3, 1])
         
         with col1:
-            fig1 = px.scatter(df, x='Response Time', y='Quality Score', 
-                             color='Category', title="Quality vs Performance")
-            st.plotly_chart(fig1, use_container_width=True)
+            _plot_keyed(
+                _evaluation_detail_fig(df[['Category', 'Response Time', 'Quality Score',
+                                           'Relevance', 'Coherence', 'Completeness']]),
+                key='eval_detail'
+            )
         
         with col2:
-            fig2 = px.bar(df, x='Category', y=['Relevance', 'Coherence', 'Completeness'],
-                         title="Quality Dimensions", barmode='group')
-            st.plotly_chart(fig2, use_container_width=True)
-        
-        with col3:
             # Summary statistics
             st.metric("Average Quality", f"{df['Quality Score'].mean():.2f}")
             st.metric("Average Response Time", f"{df['Response Time'].mean():.2f}s")
@@ -423,27 +693,42 @@ def show_monitoring_dashboard():
                 evaluator = st.session_state.system['quality_evaluator']
                 dashboard = st.session_state.system['dashboard']
                 
-                monitoring_data = []
-                
-                for i, query in enumerate(queries):
-                    # Process query
-                    result = agent.process(query)
-                    quality_metrics = evaluator.evaluate(query, result['response'])
+                # Recent simulations are reused instead of re-hitting the
+                # LLM on every click
+                sim_cache = st.session_state.get('_sim_cache')
+                if sim_cache and time.time() - sim_cache[0] < 300:
+                    st.session_state.monitoring_data = sim_cache[1]
+                else:
+                    # All eight queries run concurrently; wall time is the
+                    # slowest one instead of the sum
+                    async def simulate():
+                        semaphore = asyncio.Semaphore(4)
+                        
+                        async def one(query):
+                            async with semaphore:
+                                result = await agent.aprocess(query)
+                                quality_metrics = await evaluator.aevaluate(query, result['response'])
+                            return result, quality_metrics
+                        
+                        return await asyncio.gather(*(one(query) for query in queries))
                     
-                    # Record in dashboard
-                    dashboard.record_agent_interaction(result, quality_metrics)
+                    monitoring_data = []
+                    for i, (result, quality_metrics) in enumerate(asyncio.run(simulate())):
+                        # Record in dashboard
+                        dashboard.record_agent_interaction(result, quality_metrics)
+                        
+                        # Store for visualization
+                        monitoring_data.append({
+                            'Interaction': i + 1,
+                            'Query': queries[i][:30] + "...",
+                            'Response Time': result['processing_time'],
+                            'Quality Score': sum(quality_metrics.values()) / len(quality_metrics),
+                            'Tools Used': len(result['selected_tools']),
+                            'Success': result['success']
+                        })
                     
-                    # Store for visualization
-                    monitoring_data.append({
-                        'Interaction': i + 1,
-                        'Query': query[:30] + "...",
-                        'Response Time': result['processing_time'],
-                        'Quality Score': sum(quality_metrics.values()) / len(quality_metrics),
-                        'Tools Used': len(result['selected_tools']),
-                        'Success': 'error' not in str(result['tool_results']).lower()
-                    })
-                
-                st.session_state.monitoring_data = monitoring_data
+                    st.session_state.monitoring_data = monitoring_data
+                    st.session_state._sim_cache = (time.time(), monitoring_data)
             
             st.success("✅ Production monitoring data generated!")
     
@@ -480,24 +765,7 @@ def show_monitoring_dashboard():
         
         df = pd.DataFrame(st.session_state.monitoring_data)
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Response time trend
-            fig1 = px.line(df, x='Interaction', y='Response Time',
-                          title="Response Time Trend",
-                          markers=True)
-            fig1.add_hline(y=df['Response Time'].mean(), 
-                          line_dash="dash", 
-                          annotation_text="Average")
-            st.plotly_chart(fig1, use_container_width=True)
-        
-        with col2:
-            # Quality distribution
-            fig2 = px.histogram(df, x='Quality Score',
-                               title="Quality Score Distribution",
-                               nbins=10)
-            st.plotly_chart(fig2, use_container_width=True)
+        _plot_keyed(_monitoring_overview_fig(df), key='monitoring_overview')
         
         # System health overview
         st.subheader("🏥 System Health Overview")
@@ -540,8 +808,11 @@ def show_multi_agent_system():
             with st.spinner("Coordinating specialist agents..."):
                 multi_agent = st.session_state.system['multi_agent']
                 
-                # Execute workflow
-                result = multi_agent.process_query(complex_query)
+                # Execute workflow with specialists dispatched concurrently,
+                # on a worker thread that owns its own event loop
+                result = _AGENT_EXECUTOR.submit(
+                    asyncio.run, multi_agent.aprocess_query(complex_query)
+                ).result()
                 
                 st.success("✅ Multi-Agent Workflow Complete!")
                 
@@ -606,10 +877,18 @@ def show_interactive_chat(agent_mode, show_traces, show_evaluations, show_monito
     
     # Initialize chat history
     if 'messages' not in st.session_state:
-        st.session_state.messages = []
+        st.session_state.messages = deque(maxlen=500)
     
-    # Display chat history
-    for message in st.session_state.messages:
+    # Display chat history - only the recent tail by default so rerender
+    # cost stays flat in long sessions
+    messages = list(st.session_state.messages)
+    if len(messages) > 50 and not st.session_state.get('show_older_messages', False):
+        if st.button(f"📜 Show older messages ({len(messages) - 50} hidden)"):
+            st.session_state.show_older_messages = True
+            st.rerun()
+        messages = messages[-50:]
+    
+    for message in messages:
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
             
@@ -649,13 +928,28 @@ def show_interactive_chat(agent_mode, show_traces, show_evaluations, show_monito
         with st.chat_message("assistant"):
             with st.spinner(f"Processing with {agent_mode.lower()}..."):
                 if agent_mode == "Single Agent":
-                    # Single agent processing
+                    # Single agent processing with streamed tokens
                     agent = st.session_state.system['agent']
-                    result = agent.process(prompt)
+                    placeholder = st.empty()
+                    token_buffer = []
+                    last_render = [0.0]
+                    
+                    async def on_token(token):
+                        token_buffer.append(token)
+                        now = time.time()
+                        # Throttle to ~100ms so Streamlit is not re-rendering
+                        # the placeholder on every single token
+                        if now - last_render[0] > 0.1:
+                            last_render[0] = now
+                            placeholder.markdown("".join(token_buffer) + "▌")
                     
-                    # Evaluate
+                    result = asyncio.run(agent.astream(prompt, on_token, session_id="chat"))
+                    placeholder.markdown(result['response'])
+                    
+                    # Evaluate via the fixed-schema array API
                     evaluator = st.session_state.system['quality_evaluator']
-                    quality_metrics = evaluator.evaluate(prompt, result['response'])
+                    metric_scores = evaluator.evaluate_array(prompt, result['response'])
+                    quality_metrics = dict(zip(evaluator.METRIC_NAMES, metric_scores.tolist()))
                     
                     response = result['response']
                     metadata = {
@@ -663,18 +957,19 @@ def show_interactive_chat(agent_mode, show_traces, show_evaluations, show_monito
                         "tools_used": result['selected_tools'],
                         "reasoning": result['reasoning']['reasoning'],
                         "quality_metrics": quality_metrics,
-                        "overall_quality": sum(quality_metrics.values()) / len(quality_metrics),
+                        "overall_quality": float(metric_scores.mean()),
                         "success": True
                     }
                 
                 else:
-                    # Multi-agent processing
+                    # Multi-agent processing on a worker thread
                     multi_agent = st.session_state.system['multi_agent']
-                    result = multi_agent.process_query(prompt)
+                    result = _AGENT_EXECUTOR.submit(multi_agent.process_query, prompt).result()
                     
-                    # Evaluate final response
+                    # Evaluate final response via the array API
                     evaluator = st.session_state.system['quality_evaluator']
-                    quality_metrics = evaluator.evaluate(prompt, result['final_response'])
+                    metric_scores = evaluator.evaluate_array(prompt, result['final_response'])
+                    quality_metrics = dict(zip(evaluator.METRIC_NAMES, metric_scores.tolist()))
                     
                     response = result['final_response']
                     metadata = {
@@ -682,12 +977,12 @@ def show_interactive_chat(agent_mode, show_traces, show_evaluations, show_monito
                         "tools_used": result.get('tools_used', []),
                         "agents_used": result.get('agents_used', ['research', 'analysis', 'writing']),
                         "quality_metrics": quality_metrics,
-                        "overall_quality": sum(quality_metrics.values()) / len(quality_metrics),
+                        "overall_quality": float(metric_scores.mean()),
                         "success": True
                     }
-                
-                # Display response
-                st.markdown(response)
+                    
+                    # Multi-agent path is not streamed; render in one shot
+                    st.markdown(response)
                 
                 # Record interaction
                 st.session_state.interaction_history.append({
@@ -697,14 +992,23 @@ def show_interactive_chat(agent_mode, show_traces, show_evaluations, show_monito
                     'quality_score': metadata['overall_quality'],
                     'timestamp': time.time()
                 })
+                df = st.session_state.history_df
+                df.loc[df.index.max() + 1 if len(df) else 0] = [
+                    metadata['processing_time'], metadata['overall_quality']
+                ]
+                if len(df) > 500:
+                    # Keep the columnar mirror as bounded as the deque it
+                    # shadows
+                    st.session_state.history_df = df.tail(500)
                 
-                # Update metrics
-                st.session_state.metrics['total_queries'] += 1
-                
-                # Update averages
-                history = st.session_state.interaction_history
-                st.session_state.metrics['avg_response_time'] = sum(h['processing_time'] for h in history) / len(history)
-                st.session_state.metrics['avg_quality_score'] = sum(h['quality_score'] for h in history) / len(history)
+                # Update metrics from running sums instead of re-scanning
+                # the whole interaction history on every chat turn
+                metrics = st.session_state.metrics
+                metrics['total_queries'] += 1
+                metrics['sum_response_time'] += metadata['processing_time']
+                metrics['sum_quality_score'] += metadata['overall_quality']
+                metrics['avg_response_time'] = metrics['sum_response_time'] / metrics['total_queries']
+                metrics['avg_quality_score'] = metrics['sum_quality_score'] / metrics['total_queries']
                 
                 # Add assistant message with metadata
                 st.session_state.messages.append({
@@ -715,8 +1019,6 @@ def show_interactive_chat(agent_mode, show_traces, show_evaluations, show_monito
                 
                 # Show live metrics
                 st.success(f"⚡ {metadata['processing_time']:.2f}s | 📊 Quality: {metadata['overall_quality']:.2f} | 🔧 Tools: {len(metadata['tools_used'])}")
-                
-                st.rerun()
 
 def show_system_status():
     st.header("📋 Production System Status")
@@ -738,18 +1040,7 @@ def show_system_status():
     # Component status
     st.subheader("🔧 Component Status")
     
-    components = [
-        {"Component": "WeaveAgent", "Status": "🟢 Active", "Version": "1.0.0", "Last Check": "Just now"},
-        {"Component": "MemoryManager", "Status": "🟢 Active", "Version": "1.0.0", "Last Check": "Just now"},
-        {"Component": "ToolRegistry", "Status": "🟢 Active", "Version": "1.0.0", "Last Check": "Just now"},
-        {"Component": "QualityEvaluator", "Status": "🟢 Active", "Version": "1.0.0", "Last Check": "Just now"},
-        {"Component": "MonitoringDashboard", "Status": "🟢 Active", "Version": "1.0.0", "Last Check": "Just now"},
-        {"Component": "MultiAgentWorkflow", "Status": "🟢 Active", "Version": "1.0.0", "Last Check": "Just now"},
-        {"Component": "OpenAI Integration", "Status": "🟢 Connected", "Version": "GPT-4o-mini", "Last Check": "Just now"}
-    ]
-    
-    df = pd.DataFrame(components)
-    st.dataframe(df, use_container_width=True)
+    st.dataframe(_components_df(), use_container_width=True)
     
     # Performance metrics
     if st.session_state.interaction_history:
@@ -761,39 +1052,27 @@ def show_system_status():
         
         with col1:
             # Response time distribution
-            times = [h['processing_time'] for h in history]
-            fig1 = px.histogram(x=times, title="Response Time Distribution", nbins=10)
-            st.plotly_chart(fig1, use_container_width=True)
+            times = tuple(h['processing_time'] for h in history)
+            _plot_keyed(_status_hist_fig(times), key='status_hist')
         
         with col2:
             # Quality score trend
-            quality_scores = [h['quality_score'] for h in history]
-            fig2 = px.line(y=quality_scores, title="Quality Score Trend", markers=True)
-            st.plotly_chart(fig2, use_container_width=True)
+            quality_scores = tuple(h['quality_score'] for h in history)
+            _plot_keyed(_status_trend_fig(quality_scores), key='status_trend')
     
     # System configuration
     st.subheader("⚙️ System Configuration")
     
-    config = {
-        "Environment": "Production Demo",
-        "OpenAI Model": "gpt-4o-mini",
-        "Max Tokens": "1500",
-        "Memory Window": "1000 interactions",
-        "Monitoring Window": "100 samples",
-        "Weave Integration": "Mock (Production Ready)",
-        "Error Handling": "Enabled",
-        "Logging Level": "INFO"
-    }
-    
     col1, col2 = st.columns(2)
     
+    # One markdown block per column instead of one widget per entry
+    items = list(_SYSTEM_CONFIG.items())
+    
     with col1:
-        for key, value in list(config.items())[:4]:
-            st.text(f"{key}: {value}")
+        st.markdown('\n'.join(f"- **{key}**: {value}" for key, value in items[:4]))
     
     with col2:
-        for key, value in list(config.items())[4:]:
-            st.text(f"{key}: {value}")
+        st.markdown('\n'.join(f"- **{key}**: {value}" for key, value in items[4:]))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -47,34 +47,197 @@ class RLAgent(WeaveAgent):
     
     def process_with_feedback(self, query):
         return self.process(query)
-from monitoring.monitors import MonitoringDashboard
-from evaluation.evaluators import ResponseQualityEvaluator
-from multi_agent.workflow import MultiAgentWorkflow
-import plotly.express as px
-import pandas as pd
+import csv
+import html
+import io
 import json
+import queue
+import threading
 import time
+from collections import Counter, deque
 
 load_dotenv()
 
+def _lttb(x, y, n_out=500):
+    """Largest-Triangle-Three-Buckets downsampling
+
+    Keeps the visual shape of a series while capping how many points
+    Plotly has to serialize and the browser has to render.
+    """
+    n = len(x)
+    if n <= n_out:
+        return list(x), list(y)
+    
+    sampled_x = [x[0]]
+    sampled_y = [y[0]]
+    bucket_size = (n - 2) / (n_out - 2)
+    a = 0
+    
+    for i in range(n_out - 2):
+        start = int(i * bucket_size) + 1
+        end = min(int((i + 1) * bucket_size) + 1, n - 1)
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        span = max(next_end - next_start, 1)
+        avg_x = sum(x[next_start:next_end]) / span
+        avg_y = sum(y[next_start:next_end]) / span
+        
+        best = start
+        best_area = -1.0
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best_area = area
+                best = j
+        sampled_x.append(x[best])
+        sampled_y.append(y[best])
+        a = best
+    
+    sampled_x.append(x[-1])
+    sampled_y.append(y[-1])
+    return sampled_x, sampled_y
+
+@st.cache_data
+def _stats_csv(stats):
+    """Render agent stats to CSV once per unique history"""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=["time", "tools", "query"])
+    writer.writeheader()
+    writer.writerows(dict(zip(("time", "tools", "query"), row)) for row in stats)
+    return buf.getvalue()
+
+def _plot_keyed(fig, key):
+    """Render a chart under a stable widget key
+
+    A stable key preserves element identity across reruns, so the
+    frontend patches the existing chart in place instead of remounting
+    it, and Streamlit's forward-message cache can skip re-sending
+    payloads for figures whose data has not changed (the cached builders
+    return the identical figure object in that case).
+    """
+    st.plotly_chart(fig, use_container_width=True, key=key)
+
+@st.cache_data(max_entries=32)
+def _tool_usage_fig(version, items):
+    """Build the sidebar tool-usage chart
+
+    Keyed on the stats version plus the count snapshot itself: the
+    version short-circuits reruns within a session, while the data in
+    the key keeps the global cache from serving one session's chart to
+    another whose counter happens to match.
+    """
+    import plotly.express as px
+    return px.bar(x=[t for t, _ in items], y=[c for _, c in items], title="Tool Usage")
+
+@st.cache_data(max_entries=32)
+def _response_trend_fig(version, times):
+    """Build the response-time trend chart, keyed on version plus series"""
+    import plotly.graph_objects as go
+    times = list(times)
+    x, y = _lttb(list(range(len(times))), times)
+    mode = 'lines+markers' if len(times) < 500 else 'lines'
+    fig = go.Figure(go.Scattergl(x=x, y=y, mode=mode))
+    # Hover bookkeeping is per source point; switch it off once the
+    # series is long enough that individual points stop being meaningful
+    fig.update_layout(
+        title="Response Time Trend",
+        xaxis_title="Query #",
+        yaxis_title="Time (s)",
+        showlegend=False,
+        hovermode='x' if len(times) < 50_000 else False,
+        spikedistance=0
+    )
+    return fig
+
+@st.cache_data(ttl=2)
+def _mem_stats(_agent, n):
+    """Memory stats, cached until new turns change the message count"""
+    return _agent.memory.get_memory_stats()
+
+@st.cache_data(ttl=2)
+def _tool_stats(_agent, n):
+    """Tool stats, cached until new turns change the message count"""
+    return _agent.tools.get_tool_stats()
+
+@st.fragment(run_every="5s")
+def _live_statistics():
+    """Sidebar statistics panel, rerun on its own schedule
+
+    As a fragment this refreshes every few seconds without forcing the
+    rest of the page (chat area, component init) to rerun with it.
+    """
+    if st.session_state.agent_stats:
+        avg_time = st.session_state.time_sum / st.session_state.time_count
+        st.metric("Avg Response Time", f"{avg_time:.2f}s")
+        st.metric("Total Queries", st.session_state.time_count)
+        
+        # Tools usage chart
+        if st.session_state.tool_counter:
+            items = tuple(st.session_state.tool_counter.most_common())
+            fig = _tool_usage_fig(st.session_state.stats_version, items)
+            _plot_keyed(fig, key='tool_usage')
+
+@st.fragment(run_every="5s")
+def _monitoring_panel(agent, dashboard):
+    """Monitoring column, rerun independently of chat submissions"""
+    # Real-time metrics
+    if st.session_state.agent_stats:
+        # Full history; the figure helper downsamples past 500 points
+        times = [s["time"] for s in st.session_state.agent_stats]
+        
+        # Performance chart
+        fig = _response_trend_fig(st.session_state.stats_version, tuple(times))
+        _plot_keyed(fig, key='response_trend')
+        
+        # Memory stats
+        memory_stats = _mem_stats(agent, len(st.session_state.messages))
+        st.subheader("🧠 Memory")
+        st.json(memory_stats)
+        
+        # Tool stats
+        tool_stats = _tool_stats(agent, len(st.session_state.messages))
+        st.subheader("🔧 Tools")
+        for tool, stats in tool_stats.items():
+            st.metric(
+                f"{tool}", 
+                f"{stats['usage_count']} uses",
+                f"{stats['success_rate']:.1%} success"
+            )
+    
+    # Dashboard summary
+    if st.button("🔄 Refresh Dashboard"):
+        summary = dashboard.get_dashboard_summary()
+        st.subheader("📊 Dashboard Summary")
+        st.json(summary)
+
+# One cached function per resource: flipping the RL toggle only needs to
+# rebuild the agent, so everything else stays warm instead of being torn
+# down by a blanket st.cache_resource.clear()
 @st.cache_resource
-def initialize_components(use_openpipe=False):
-    """Initialize agent components"""
+def _weave_init():
     weave.init("weave-agent-streamlit")
-    has_openai_key = bool(os.getenv("OPENAI_API_KEY"))
-    
+    return True
+
+@st.cache_resource
+def _agent(use_openpipe):
     if use_openpipe:
-        agent = RLAgent(use_openpipe=True, use_mock=True)
-    else:
-        agent = WeaveAgent(use_mock=True)
-    
-    # Mock components
-    dashboard = type('Dashboard', (), {
+        return RLAgent(use_openpipe=True, use_mock=True)
+    return WeaveAgent(use_mock=True)
+
+@st.cache_resource
+def _dashboard():
+    return type('Dashboard', (), {
         'record_agent_interaction': lambda self, x: None,
         'get_dashboard_summary': lambda self: {'status': 'mock'}
     })()
-    evaluator = type('Evaluator', (), {})()
-    multi_agent = type('MultiAgent', (), {
+
+@st.cache_resource
+def _evaluator():
+    return type('Evaluator', (), {})()
+
+@st.cache_resource
+def _multi_agent():
+    return type('MultiAgent', (), {
         'process_query': lambda self, query: {
             'final_response': f'Multi-agent mock response for: {query}',
             'processing_time': 0.1,
@@ -84,16 +247,57 @@ def initialize_components(use_openpipe=False):
             'task_analysis': {'specialists_needed': ['research']}
         }
     })()
-    return agent, dashboard, evaluator, multi_agent
+
+def initialize_components(use_openpipe=False):
+    """Initialize agent components"""
+    _weave_init()
+    return _agent(use_openpipe), _dashboard(), _evaluator(), _multi_agent()
+
+@st.cache_resource
+def _recorder_queue():
+    """Queue drained by a daemon thread for dashboard recording
+
+    Recording an interaction can touch disk or the network; doing it on
+    a background thread keeps it off the user-visible chat latency path.
+    cache_resource guards against spawning a new thread per rerun.
+    """
+    q = queue.Queue()
+    
+    def drain():
+        while True:
+            dashboard, result = q.get()
+            try:
+                dashboard.record_agent_interaction(result)
+            except Exception:
+                # A bad record must not kill the drain thread
+                pass
+    
+    threading.Thread(target=drain, daemon=True).start()
+    return q
 
 def main():
     st.set_page_config(page_title="W&B Weave Agent", page_icon="🤖", layout="wide")
     
     # Initialize session state
     if "messages" not in st.session_state:
-        st.session_state.messages = []
+        # Bounded so session memory and per-rerun scans stay flat no
+        # matter how long the session runs; matches the 1000-interaction
+        # memory window in the config panel
+        st.session_state.messages = deque(maxlen=1000)
     if "agent_stats" not in st.session_state:
-        st.session_state.agent_stats = []
+        st.session_state.agent_stats = deque(maxlen=1000)
+    if "tool_counter" not in st.session_state:
+        # Incremental tally; updated on append so the sidebar never
+        # rescans every historical interaction for tool names
+        st.session_state.tool_counter = Counter()
+    if "stats_version" not in st.session_state:
+        # Bumped only when agent_stats grows; chart caches key on it
+        st.session_state.stats_version = 0
+    if "time_sum" not in st.session_state:
+        # Running totals so the sidebar average is O(1) instead of a
+        # full scan of agent_stats on every rerun
+        st.session_state.time_sum = 0.0
+        st.session_state.time_count = 0
     if "use_openpipe" not in st.session_state:
         st.session_state.use_openpipe = False
     
@@ -127,7 +331,7 @@ def main():
         
         if openpipe_enabled != st.session_state.use_openpipe:
             st.session_state.use_openpipe = openpipe_enabled
-            st.cache_resource.clear()
+            _agent.clear()
             st.rerun()
         
         if openpipe_enabled:
@@ -139,7 +343,8 @@ def main():
             
             if st.button("📊 Export Training Data"):
                 if hasattr(agent, 'training_data') and agent.training_data:
-                    data = json.dumps(agent.training_data, indent=2)
+                    # Compact separators keep the download payload small
+                    data = json.dumps(agent.training_data, separators=(',', ':'))
                     st.download_button(
                         "Download Training Data",
                         data,
@@ -151,21 +356,7 @@ def main():
                     st.info("No training data collected yet")
         
         st.header("📊 Live Statistics")
-        if st.session_state.agent_stats:
-            avg_time = sum(s["time"] for s in st.session_state.agent_stats) / len(st.session_state.agent_stats)
-            st.metric("Avg Response Time", f"{avg_time:.2f}s")
-            st.metric("Total Queries", len(st.session_state.agent_stats))
-            
-            # Tools usage chart
-            tools_used = []
-            for stat in st.session_state.agent_stats:
-                tools_used.extend(stat.get("tools", []))
-            
-            if tools_used:
-                tools_df = pd.DataFrame({"Tool": tools_used})
-                tool_counts = tools_df["Tool"].value_counts()
-                fig = px.bar(x=tool_counts.index, y=tool_counts.values, title="Tool Usage")
-                st.plotly_chart(fig, use_container_width=True)
+        _live_statistics()
     
     # Main chat interface
     col1, col2 = st.columns([2, 1])
@@ -173,16 +364,28 @@ def main():
     with col1:
         st.header("💬 Chat Interface")
         
-        # Display chat messages
-        for i, message in enumerate(st.session_state.messages):
-            if message["role"] == "user":
-                st.markdown(f"**You:** {message['content']}")
-            else:
-                st.markdown(f"**Agent:** {message['content']}")
-                if "metadata" in message:
-                    with st.expander(f"📊 Details {i}"):
-                        st.json(message["metadata"])
-            st.markdown("---")
+        # Display chat messages as one markdown block - a single message
+        # to the browser instead of two or three widgets per turn
+        if st.session_state.messages:
+            html_parts = []
+            for message in st.session_state.messages:
+                speaker = "You" if message["role"] == "user" else "Agent"
+                html_parts.append(
+                    f"<div><b>{speaker}:</b> {html.escape(message['content'])}</div><hr/>"
+                )
+            st.markdown(''.join(html_parts), unsafe_allow_html=True)
+            
+            # One on-demand detail view: only the selected message's
+            # metadata is serialized, instead of every turn's dict
+            meta_indices = [i for i, m in enumerate(st.session_state.messages) if "metadata" in m]
+            if meta_indices:
+                idx = st.selectbox(
+                    "📊 Inspect message",
+                    options=meta_indices,
+                    index=len(meta_indices) - 1,
+                    format_func=lambda i: f"Message {i}"
+                )
+                st.json(st.session_state.messages[idx]["metadata"])
         
         # Chat input using text_input and button
         with st.form(key="chat_form", clear_on_submit=True):
@@ -232,6 +435,10 @@ def main():
                     "tools": result.get("selected_tools", []),
                     "query": prompt
                 })
+                st.session_state.time_sum += end_time - start_time
+                st.session_state.time_count += 1
+                st.session_state.tool_counter.update(result.get("selected_tools", []))
+                st.session_state.stats_version += 1
                 
                 # Add assistant message
                 st.session_state.messages.append({
@@ -240,53 +447,18 @@ def main():
                     "metadata": metadata
                 })
                 
-                # Record in dashboard
-                dashboard.record_agent_interaction(result)
+                # Record in dashboard off the response path
+                _recorder_queue().put_nowait((dashboard, result))
                 
                 # Display response
                 st.markdown(f"**Agent:** {response}")
                 
                 if show_metrics:
                     st.success(f"⚡ Processed in {metadata['processing_time']:.2f}s")
-                
-                st.rerun()
     
     with col2:
         st.header("📈 Monitoring")
-        
-        # Real-time metrics
-        if st.session_state.agent_stats:
-            recent_times = [s["time"] for s in st.session_state.agent_stats[-10:]]
-            
-            # Performance chart
-            fig = px.line(
-                x=list(range(len(recent_times))), 
-                y=recent_times,
-                title="Response Time Trend",
-                labels={"x": "Query #", "y": "Time (s)"}
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Memory stats
-            memory_stats = agent.memory.get_memory_stats()
-            st.subheader("🧠 Memory")
-            st.json(memory_stats)
-            
-            # Tool stats
-            tool_stats = agent.tools.get_tool_stats()
-            st.subheader("🔧 Tools")
-            for tool, stats in tool_stats.items():
-                st.metric(
-                    f"{tool}", 
-                    f"{stats['usage_count']} uses",
-                    f"{stats['success_rate']:.1%} success"
-                )
-        
-        # Dashboard summary
-        if st.button("🔄 Refresh Dashboard"):
-            summary = dashboard.get_dashboard_summary()
-            st.subheader("📊 Dashboard Summary")
-            st.json(summary)
+        _monitoring_panel(agent, dashboard)
     
     # Footer
     st.markdown("---")
@@ -294,17 +466,24 @@ def main():
     
     with col1:
         if st.button("🗑️ Clear Chat"):
-            st.session_state.messages = []
-            st.session_state.agent_stats = []
+            st.session_state.messages = deque(maxlen=1000)
+            st.session_state.agent_stats = deque(maxlen=1000)
+            st.session_state.time_sum = 0.0
+            st.session_state.time_count = 0
+            st.session_state.tool_counter = Counter()
+            st.session_state.stats_version += 1
             st.rerun()
     
     with col2:
         if st.button("📊 Export Stats"):
             if st.session_state.agent_stats:
-                df = pd.DataFrame(st.session_state.agent_stats)
+                rows = tuple(
+                    (s["time"], tuple(s.get("tools", [])), s["query"])
+                    for s in st.session_state.agent_stats
+                )
                 st.download_button(
                     "Download CSV",
-                    df.to_csv(index=False),
+                    _stats_csv(rows),
                     "agent_stats.csv",
                     "text/csv"
                 )